@@ -0,0 +1,64 @@
+"""
+Import-time benchmark for the project's entry points.
+
+Runs each module in a fresh interpreter with ``python -X importtime`` and
+reports its cumulative import time, the slowest dependencies it pulled in,
+and whether PyMuPDF was loaded. Run from the repository root:
+
+    python benchmarks/import_time.py [module ...]
+"""
+import os
+import sys
+import subprocess
+from typing import Dict, List, Tuple
+
+ENTRY_POINTS = [
+    "csv_processor",
+    "grade_processor",
+    "prospectus_processor",
+    "grade_statistics",
+    "timetable_scheduler",
+    "eligibility_projection",
+    "shard_router",
+    "seat_allocator",
+    "degree_audit",
+    "student_search",
+]
+
+HEAVY_MODULES = ("fitz", "pymupdf", "PIL", "tkinter", "multiprocessing")
+
+def measure(module: str, repeat: int = 5) -> Tuple[int, Dict[str, int]]:
+    """Returns the best cumulative import time of a module in microseconds and its imports."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    best, best_imports = None, {}
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=root, capture_output=True, text=True, check=True,
+        )
+        imports = {}
+        for line in result.stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative_us, name = line[len("import time:"):].split("|")
+            imports[name.strip()] = int(cumulative_us)
+        total = imports.get(module, 0)
+        if best is None or total < best:
+            best, best_imports = total, imports
+    return best, best_imports
+
+def main(modules: List[str]) -> None:
+    print(f"{'module':<24}{'import ms':>10}  heavy dependencies / slowest imports")
+    for module in modules:
+        total, imports = measure(module)
+        heavy = sorted({name.split('.')[0] for name in imports if name.split('.')[0] in HEAVY_MODULES})
+        slowest = sorted(
+            ((name, us) for name, us in imports.items() if name != module),
+            key=lambda item: -item[1],
+        )[:3]
+        detail = ", ".join(heavy) if heavy else ", ".join(f"{name} {us / 1000:.1f}ms" for name, us in slowest)
+        print(f"{module:<24}{total / 1000:>10.1f}  {detail}")
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ENTRY_POINTS)
@@ -0,0 +1,68 @@
+"""
+Microbenchmark for the study plan parser.
+
+Generates synthetic study plans in the layout PyMuPDF extracts from the
+prospectus (split codes, multi-line titles, labs, blank prerequisites) and
+reports parsing throughput as plans grow. Run from the repository root:
+
+    python benchmarks/parse_study_plan.py [semesters ...]
+"""
+import os
+import sys
+import random
+import timeit
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from study_plan_parser import parse_study_plan  # noqa: E402
+
+ROMAN = [(50, 'L'), (40, 'XL'), (10, 'X'), (9, 'IX'), (5, 'V'), (4, 'IV'), (1, 'I')]
+WORDS = ["Advanced", "Applied", "Computing", "Data", "Systems", "Theory", "Design", "Networks", "Security"]
+
+def _roman(number: int) -> str:
+    numeral = ""
+    for value, symbol in ROMAN:
+        while number >= value:
+            numeral += symbol
+            number -= value
+    return numeral
+
+def generate_plan(semesters: int, courses_per_semester: int = 6, seed: int = 0) -> str:
+    """Returns study plan text with the given number of semesters."""
+    rng = random.Random(seed)
+    lines: List[str] = ["Code", "Title", "Cr.Hrs", "Prereq"]
+    previous = None
+    for semester in range(1, semesters + 1):
+        lines.append(f"Semester-{_roman(semester)}")
+        for number in range(courses_per_semester):
+            code = f"CS{semester:02d}{number:02d}"
+            if rng.random() < 0.1:
+                lines.extend(["SS/", f"MG{semester:02d}{number:02d}"])
+            else:
+                lines.append(code)
+            # Titles wrap over up to three lines in the extracted text
+            for _ in range(rng.randint(1, 3)):
+                lines.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4))))
+            lines.append(str(rng.choice((2, 3))))
+            lines.append(rng.choice((" 0", "1")))
+            lines.append(previous if previous and rng.random() < 0.5 else " ")
+            previous = code
+        lines.extend(["Total", str(courses_per_semester * 3), str(courses_per_semester)])
+    lines.extend(["Eligibility for FYP-I: 95 CH", "Total", "133"])
+    return "\n".join(lines)
+
+def main(sizes: List[int]) -> None:
+    print(f"{'semesters':>10}{'lines':>10}{'courses':>10}{'ms':>10}{'lines/s':>14}")
+    for semesters in sizes:
+        text = generate_plan(semesters)
+        line_count = text.count("\n") + 1
+        courses, malformed = parse_study_plan(text, "Synthetic")
+        assert not malformed, malformed
+
+        runs, total = timeit.Timer(lambda: parse_study_plan(text, "Synthetic")).autorange()
+        seconds = total / runs
+        print(f"{semesters:>10}{line_count:>10}{len(courses):>10}{seconds * 1000:>10.2f}{line_count / seconds:>14,.0f}")
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [8, 16, 32, 64])
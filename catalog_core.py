@@ -0,0 +1,227 @@
+import re
+import sqlite3
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from constants.database import config
+from constants.database import schema
+from constants.database import insertions
+from constants.database import queries
+
+# Version stamp bumped whenever courses, program offerings, study plans or batch catalogs change
+CATALOG_VERSION = 'catalog'
+CATALOG_TABLES = ('courses', 'program_courses', 'study_plan_slots', 'catalog_courses')
+
+# Roll numbers start with the intake year of their batch, e.g. 22P-3000 is batch 22
+ROLL_NO_BATCH_PATTERN = re.compile(r'^(\d+)')
+
+@dataclass(frozen=True, slots=True)
+class Course:
+    course_code: str
+    course_title: str
+    credit_hours: int
+    prerequisite_course_code: Optional[str] = None
+
+LAB_TITLE_SUFFIX = " - Lab"
+
+def roll_no_batch(roll_no: str) -> Optional[str]:
+    """Returns the batch of a roll number, e.g. '22' for 22P-3000, or None."""
+    match = ROLL_NO_BATCH_PATTERN.match(roll_no.strip())
+    return match.group(1) if match else None
+
+def derive_lab_code(course_code: str) -> str:
+    """Returns the code of a course's lab, e.g. CL2005 for CS2005."""
+    return course_code[:1] + 'L' + course_code[2:]
+
+def is_lab(course: Course) -> bool:
+    return course.course_title.endswith(LAB_TITLE_SUFFIX)
+
+def append_courses_and_labs(courses: List[Tuple[Course, str, int]],
+                            course_code: str, course_title: str,
+                            credit_hours_class: int, credit_hours_lab: int,
+                            prereq: str, program_name: str, semester: int) -> None:
+    """
+    Appends the base course and lab course (if applicable) to the courses list.
+
+    Args:
+        courses: The list of courses to append to.
+        course_code: The course code.
+        course_title: The course title.
+        credit_hours_class: The credit hours for the class.
+        credit_hours_lab: The credit hours for the lab.
+        prereq: Prerequisite course code (if any).
+        program_name: The program name.
+        semester: The semester number.
+    """
+    # Append the base course
+    courses.append((Course(
+        course_code=course_code,
+        course_title=course_title,
+        credit_hours=credit_hours_class + (credit_hours_lab if credit_hours_lab > 1 else 0),
+        prerequisite_course_code=prereq,
+    ), program_name, semester))
+
+    # Append the lab course if lab credits = 1
+    if credit_hours_lab == 1:
+        lab_code = derive_lab_code(course_code)
+        lab_title = f"{course_title}{LAB_TITLE_SUFFIX}"
+        courses.append((Course(
+            course_code=lab_code,
+            course_title=lab_title,
+            credit_hours=1,
+            prerequisite_course_code=prereq,
+        ), program_name, semester))
+
+def initialize_data_versions(conn: sqlite3.Connection, name: str, tables: Tuple[str, ...]) -> None:
+    """Creates a version stamp and the triggers bumping it when any of the tables change."""
+    cursor = conn.cursor()
+    cursor.execute(schema.CREATE_TABLE_DATA_VERSIONS)
+    cursor.execute(insertions.INSERT_DATA_VERSION, (name,))
+    for table in tables:
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            cursor.execute(schema.data_version_trigger_template.format(
+                table=table, event=event, name=name
+            ))
+
+def initialize_catalog_versions(conn: sqlite3.Connection) -> None:
+    """Creates the catalog version stamp and the triggers bumping it."""
+    # Added after the other catalog tables, so older databases may lack them
+    conn.execute(schema.CREATE_TABLE_STUDY_PLAN_SLOTS)
+    conn.execute(schema.CREATE_TABLE_CATALOGS)
+    conn.execute(schema.CREATE_TABLE_COURSE_DEFINITIONS)
+    conn.execute(schema.CREATE_TABLE_CATALOG_COURSES)
+    initialize_data_versions(conn, CATALOG_VERSION, CATALOG_TABLES)
+
+class CatalogWriter:
+    """
+    Writes parsed courses to the catalog tables.
+
+    Kept free of PDF and GUI dependencies so CSV loads stay cheap to import.
+    The schema is created on the first write, not on construction.
+    """
+
+    def __init__(self, db_path: str = config.DB_NAME):
+        self.db_path = db_path
+        self.logger = logging.getLogger(__name__)
+        self._schema_ready = False
+
+    def _initialize_database(self):
+        """Sets up the database schema if it does not already exist."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            
+            # Create tables using schema constants
+            cursor.execute(schema.CREATE_TABLE_PROGRAMS)
+            cursor.execute(schema.CREATE_TABLE_COURSES)
+            cursor.execute(schema.CREATE_TABLE_PROGRAM_COURSES)
+            cursor.execute(schema.CREATE_TABLE_STUDY_PLAN_SLOTS)
+            cursor.execute(schema.CREATE_TABLE_CATALOGS)
+            cursor.execute(schema.CREATE_TABLE_COURSE_DEFINITIONS)
+            cursor.execute(schema.CREATE_TABLE_CATALOG_COURSES)
+            cursor.execute(schema.CREATE_INDEX_CATALOG_COURSES_CODE)
+            cursor.execute(schema.CREATE_INDEX_CATALOG_COURSES_DEFINITION)
+            initialize_catalog_versions(conn)
+
+            self.logger.info("Database schema initialized.")
+        self._schema_ready = True
+
+    @staticmethod
+    def definition_id(course: Course) -> str:
+        """Returns the content hash identifying a course definition."""
+        content = "\x1f".join((
+            course.course_code, course.course_title,
+            str(course.credit_hours), course.prerequisite_course_code or "",
+        ))
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    def insert_courses(self, courses: List[Tuple[Course, str, int]], batch: Optional[str] = None):
+        """
+        Inserts courses into the database in a single pass.
+
+        Args:
+            courses: The parsed courses with their program and semester.
+            batch: When given, the courses are also stored as that batch's
+                catalog, sharing identical definitions with other batches.
+        """
+        programs = {program for _, program, _ in courses}
+        course_data = {}
+        program_courses = []
+        slots: Dict[Tuple[str, int], List[Tuple[str, int, int, str, int]]] = {}
+
+        for course, program_name, semester in courses:
+            course_data[course.course_code] = (
+                course.course_code, course.course_title, course.credit_hours,
+                course.prerequisite_course_code or None
+            )
+            program_courses.append((program_name, course.course_code, semester))
+            # Unlike program_courses, slots keep repeated placeholders and their own credit hours
+            semester_slots = slots.setdefault((program_name, semester), [])
+            semester_slots.append((
+                program_name, semester, len(semester_slots), course.course_code, course.credit_hours
+            ))
+
+        if not self._schema_ready:
+            self._initialize_database()
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("PRAGMA foreign_keys = ON")
+            # Prerequisites may reference courses later in the same load, so
+            # constraints are checked once at commit instead of per row.
+            # The pragma resets on every commit and must be set in the transaction.
+            conn.execute("BEGIN")
+            conn.execute("PRAGMA defer_foreign_keys = ON")
+            cursor = conn.cursor()
+
+            try:
+                # Bulk insertions
+                self.logger.debug(f"Inserting programs: {programs}")
+                cursor.executemany(insertions.INSERT_PROGRAM, [(program,) for program in programs])
+                cursor.executemany(insertions.INSERT_COURSE, course_data.values())
+
+                self.logger.debug(f"Inserting program-course associations: {program_courses}")
+                cursor.executemany(insertions.INSERT_PROGRAM_COURSE, program_courses)
+                cursor.executemany(insertions.DELETE_STUDY_PLAN_SLOTS, slots.keys())
+                cursor.executemany(
+                    insertions.INSERT_STUDY_PLAN_SLOT,
+                    [slot for semester_slots in slots.values() for slot in semester_slots]
+                )
+
+                if batch is not None:
+                    self._insert_catalog(cursor, batch, courses)
+                conn.commit()
+
+                self.logger.info(f"Rows inserted into the database.")
+            except sqlite3.Error as e:
+                self.logger.error(f"Error inserting data into database: {e}")
+                conn.rollback()
+                raise
+            except Exception as e:
+                self.logger.error(f"Unexpected error occurred: {e}")
+                raise
+
+    def _insert_catalog(self, cursor: sqlite3.Cursor, batch: str,
+                        courses: List[Tuple[Course, str, int]]) -> None:
+        """Replaces a batch's catalog, storing each distinct definition once."""
+        definitions = {}
+        catalog_courses = []
+        for course, program_name, semester in courses:
+            definition_id = self.definition_id(course)
+            definitions[definition_id] = (
+                definition_id, course.course_code, course.course_title,
+                course.credit_hours, course.prerequisite_course_code or None
+            )
+            catalog_courses.append((batch, program_name, course.course_code, semester, definition_id))
+
+        self.logger.debug(f"Inserting catalog for batch {batch}: {len(catalog_courses)} courses")
+        cursor.execute(insertions.INSERT_CATALOG, (batch,))
+        cursor.execute(insertions.DELETE_CATALOG_COURSES, (batch,))
+        cursor.executemany(insertions.INSERT_COURSE_DEFINITION, definitions.values())
+        cursor.executemany(insertions.INSERT_CATALOG_COURSE, catalog_courses)
+
+    def fetch_catalog_courses(self, batch: str, program_name: str, semester: int) -> List[Course]:
+        """Returns a batch's courses for a program and semester."""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(queries.fetch_catalog_courses, (batch, program_name, semester)).fetchall()
+        return [Course(*row) for row in rows]
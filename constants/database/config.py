@@ -1,3 +1,10 @@
 # Database Configuration Constants
 
-DB_NAME = 'project.sqlite3'
\ No newline at end of file
+DB_NAME = 'project.sqlite3'
+
+# Number of students that fit in a single course section
+SECTION_CAPACITY = 50
+
+# Sharded layout: one database per batch or campus, plus a shared catalog
+SHARD_DIR = 'shards'
+CATALOG_DB_NAME = 'catalog.sqlite3'
@@ -4,10 +4,19 @@ INSERT_PROGRAM = '''
 INSERT OR IGNORE INTO programs (program_name) VALUES (?)
 '''
 
+# Later catalogs overwrite earlier definitions instead of being ignored;
+# each batch keeps its own definitions in catalog_courses
 INSERT_COURSE = '''
-INSERT OR IGNORE INTO courses (
+INSERT INTO courses (
     course_code, course_title, credit_hours, prerequisite_course_code
 ) VALUES (?, ?, ?, ?)
+ON CONFLICT (course_code) DO UPDATE SET
+    course_title = excluded.course_title,
+    credit_hours = excluded.credit_hours,
+    prerequisite_course_code = excluded.prerequisite_course_code
+WHERE course_title IS NOT excluded.course_title
+    OR credit_hours IS NOT excluded.credit_hours
+    OR prerequisite_course_code IS NOT excluded.prerequisite_course_code
 '''
 
 INSERT_PROGRAM_COURSE = '''
@@ -15,6 +24,16 @@ INSERT OR IGNORE INTO program_courses (program_name, course_code, semester)
 VALUES (?, ?, ?)
 '''
 
+# A load replaces the study plan of each program and semester it contains
+DELETE_STUDY_PLAN_SLOTS = '''
+DELETE FROM study_plan_slots WHERE program_name = ? AND semester = ?
+'''
+
+INSERT_STUDY_PLAN_SLOT = '''
+INSERT INTO study_plan_slots (program_name, semester, slot, course_code, credit_hours)
+VALUES (?, ?, ?, ?, ?)
+'''
+
 INSERT_STUDENT = '''
 INSERT OR REPLACE INTO students (
     roll_no, 
@@ -33,3 +52,114 @@ INSERT_GRADE = '''
 INSERT OR IGNORE INTO grades (roll_no, course_code, grade)
 VALUES (?, ?, ?)
 '''
+
+INSERT_CATALOG = '''
+INSERT OR IGNORE INTO catalogs (batch) VALUES (?)
+'''
+
+# Reloading a batch replaces its course references
+DELETE_CATALOG_COURSES = '''
+DELETE FROM catalog_courses WHERE batch = ?
+'''
+
+INSERT_COURSE_DEFINITION = '''
+INSERT OR IGNORE INTO course_definitions (
+    definition_id, course_code, course_title, credit_hours, prerequisite_course_code
+) VALUES (?, ?, ?, ?, ?)
+'''
+
+INSERT_CATALOG_COURSE = '''
+INSERT OR REPLACE INTO catalog_courses (
+    batch, program_name, course_code, semester, definition_id
+) VALUES (?, ?, ?, ?, ?)
+'''
+
+INSERT_GRADE_POINTS = '''
+INSERT OR REPLACE INTO grade_points (grade, points, outcome)
+VALUES (?, ?, ?)
+'''
+
+# Only seeds the default mapping; deployments may change section_programs
+INSERT_SECTION_PROGRAM = '''
+INSERT OR IGNORE INTO section_programs (section_prefix, program_name)
+VALUES (?, ?)
+'''
+
+# Full rebuild of the materialized grade statistics
+REBUILD_COURSE_GRADE_STATS = '''
+INSERT INTO course_grade_stats (course_code, grade, students)
+SELECT course_code, grade, COUNT(*)
+FROM grades
+GROUP BY course_code, grade
+'''
+
+REBUILD_SECTION_GRADE_STATS = '''
+INSERT INTO section_grade_stats (section, course_code, grade, students)
+SELECT s.section, g.course_code, g.grade, COUNT(*)
+FROM grades g
+JOIN students s ON s.roll_no = g.roll_no
+GROUP BY s.section, g.course_code, g.grade
+'''
+
+REBUILD_PROGRAM_GRADE_STATS = '''
+INSERT INTO program_grade_stats (program_name, course_code, grade, students)
+SELECT sp.program_name, g.course_code, g.grade, COUNT(*)
+FROM grades g
+JOIN students s ON s.roll_no = g.roll_no
+JOIN section_programs sp
+ON sp.section_prefix = substr(s.section, 1, instr(s.section, '-') - 1)
+GROUP BY sp.program_name, g.course_code, g.grade
+'''
+
+# Every import gets its own source, even when the file name is reused
+INSERT_GRADE_SOURCE = '''
+INSERT INTO grade_sources (source_name) VALUES (?)
+'''
+
+DELETE_GRADE_SOURCE = '''
+DELETE FROM grade_sources WHERE source_id = ?
+'''
+
+# Grade sheets are cumulative, so a grade is only a new attempt when the
+# student has none for the course yet or it differs from the latest one
+INSERT_GRADE_ATTEMPT = '''
+INSERT INTO grade_attempts (roll_no, course_code, grade, term, source_id)
+SELECT ?1, ?2, ?3, ?4, ?5
+WHERE ?3 IS NOT (
+    SELECT grade FROM grade_attempts
+    WHERE roll_no = ?1 AND course_code = ?2
+    ORDER BY term DESC, attempt_id DESC
+    LIMIT 1
+)
+'''
+
+# One-time backfill of grades recorded before attempts were tracked
+BACKFILL_GRADE_ATTEMPTS = '''
+INSERT INTO grade_attempts (roll_no, course_code, grade, term, source_id)
+SELECT roll_no, course_code, grade, '', ?
+FROM grades
+'''
+
+# Stamps start at a random value, so a recreated database does not reuse
+# the versions of snapshots taken from the one it replaced
+INSERT_DATA_VERSION = '''
+INSERT OR IGNORE INTO data_versions (name, version) VALUES (?, abs(random() % 1000000000))
+'''
+
+DELETE_DEGREE_AUDITS = '''
+DELETE FROM degree_audits WHERE program_name = ?
+'''
+
+INSERT_DEGREE_AUDIT = '''
+INSERT INTO degree_audits (
+    program_name, roll_no, name, section, current_semester, outstanding_courses,
+    outstanding_labs, outstanding_electives, remaining_credit_hours,
+    projected_graduation_semester
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+INSERT_DEGREE_AUDIT_RUN = '''
+INSERT OR REPLACE INTO degree_audit_runs (
+    program_name, catalog_version, grades_version, credit_load
+) VALUES (?, ?, ?, ?)
+'''
@@ -49,3 +49,368 @@ get_eligible_students = '''
                 AND prerequisite.course_code = ?
             );
         '''
+
+
+# Same eligibility rule as get_eligible_students, for every course at once
+get_eligible_rolls_by_course = '''
+        SELECT 
+            c.course_code, 
+            s.roll_no
+        FROM 
+            students s
+        JOIN 
+            grades g
+        ON 
+            s.roll_no = g.roll_no
+        JOIN 
+            courses c
+        ON 
+            g.course_code = c.course_code
+        JOIN 
+            courses prerequisite
+        ON 
+            prerequisite.course_code = c.prerequisite_course_code
+        WHERE 
+            g.grade IN ('-', 'F', 'W', 'I')
+        ORDER BY 
+            s.roll_no;
+        '''
+
+# Eligible students of every course with the columns used to rank them for seats
+get_eligible_candidates = '''
+        SELECT 
+            c.course_code, 
+            s.roll_no, 
+            s.cgpa, 
+            s.warning_status, 
+            s.credit_hours_earned
+        FROM 
+            students s
+        JOIN 
+            grades g
+        ON 
+            s.roll_no = g.roll_no
+        JOIN 
+            courses c
+        ON 
+            g.course_code = c.course_code
+        JOIN 
+            courses prerequisite
+        ON 
+            prerequisite.course_code = c.prerequisite_course_code
+        WHERE 
+            g.grade IN ('-', 'F', 'W', 'I');
+        '''
+
+# Courses of a batch's catalog for a program and semester
+fetch_catalog_courses = '''
+    SELECT 
+        d.course_code, 
+        d.course_title, 
+        d.credit_hours, 
+        d.prerequisite_course_code
+    FROM 
+        catalog_courses cc
+    JOIN 
+        course_definitions d
+    ON 
+        cc.definition_id = d.definition_id
+    WHERE 
+        cc.batch = ? 
+        AND cc.program_name = ? 
+        AND cc.semester = ?
+    ORDER BY 
+        d.course_title;
+    '''
+
+# Every batch's course definitions, for batch-aware lookups
+fetch_all_catalog_courses = '''
+    SELECT 
+        cc.batch, 
+        d.course_code, 
+        d.course_title, 
+        d.credit_hours, 
+        d.prerequisite_course_code
+    FROM 
+        catalog_courses cc
+    JOIN 
+        course_definitions d
+    ON 
+        cc.definition_id = d.definition_id
+    ORDER BY 
+        cc.batch, cc.semester;
+    '''
+
+# Grade statistics, formatted with the stats table and its grouping columns
+# (course_grade_stats / section_grade_stats / program_grade_stats)
+grade_summary_template = '''
+    SELECT 
+        {key_columns}, 
+        SUM(st.students) AS students, 
+        SUM(CASE WHEN gp.outcome = 'pass' THEN st.students ELSE 0 END) AS passed, 
+        SUM(CASE WHEN gp.outcome = 'fail' THEN st.students ELSE 0 END) AS failed, 
+        SUM(CASE WHEN gp.outcome = 'withdraw' THEN st.students ELSE 0 END) AS withdrawn, 
+        SUM(CASE WHEN gp.outcome = 'incomplete' THEN st.students ELSE 0 END) AS incomplete, 
+        SUM(st.students * gp.points) 
+            / SUM(CASE WHEN gp.points IS NOT NULL THEN st.students END) AS average_grade_points
+    FROM 
+        {table} st
+    LEFT JOIN 
+        grade_points gp
+    ON 
+        gp.grade = st.grade
+    WHERE 
+        st.students > 0
+        {filters}
+    GROUP BY 
+        {key_columns}
+    ORDER BY 
+        {key_columns};
+    '''
+
+grade_distribution_template = '''
+    SELECT 
+        st.grade, 
+        st.students
+    FROM 
+        {table} st
+    WHERE 
+        st.students > 0
+        {filters}
+    ORDER BY 
+        st.grade;
+    '''
+
+# Federated queries, run on each shard with the catalog attached as `catalog`
+shard_eligible_students = '''
+        SELECT 
+            s.roll_no, 
+            s.name
+        FROM 
+            students s
+        JOIN 
+            grades g
+        ON 
+            s.roll_no = g.roll_no
+        JOIN 
+            catalog.courses c
+        ON 
+            g.course_code = c.course_code
+        WHERE 
+            c.course_title = ? 
+            AND g.grade  IN ('-', 'F', 'W', 'I')
+            AND EXISTS (
+                SELECT 1
+                FROM catalog.courses prerequisite
+                WHERE prerequisite.course_code = c.prerequisite_course_code
+                AND prerequisite.course_code = ?
+            );
+        '''
+
+shard_course_enrollment = '''
+    SELECT 
+        c.course_code, 
+        c.course_title, 
+        COUNT(g.roll_no) AS students
+    FROM 
+        catalog.program_courses pc
+    JOIN 
+        catalog.courses c
+    ON 
+        pc.course_code = c.course_code
+    LEFT JOIN 
+        grades g
+    ON 
+        g.course_code = c.course_code
+    WHERE 
+        pc.program_name = ? 
+        AND pc.semester = ?
+    GROUP BY 
+        c.course_code, c.course_title
+    ORDER BY 
+        c.course_title;
+    '''
+
+# Every attempt of a student, oldest first
+fetch_grade_history = '''
+    SELECT 
+        ga.course_code, 
+        ga.grade, 
+        ga.term, 
+        gs.source_name, 
+        gs.imported_at
+    FROM 
+        grade_attempts ga
+    JOIN 
+        grade_sources gs
+    ON 
+        ga.source_id = gs.source_id
+    WHERE 
+        ga.roll_no = ?
+    ORDER BY 
+        ga.course_code, ga.term, ga.attempt_id;
+    '''
+
+# Section prefixes of a program, e.g. BSE for Software Engineering
+fetch_program_section_prefixes = '''
+    SELECT section_prefix FROM section_programs WHERE program_name = ?;
+    '''
+
+get_data_version = '''
+    SELECT version FROM data_versions WHERE name = ?;
+    '''
+
+# Every course and program offering, for building the in-memory catalog
+fetch_all_courses = '''
+    SELECT 
+        course_code, 
+        course_title, 
+        credit_hours, 
+        prerequisite_course_code
+    FROM 
+        courses
+    ORDER BY 
+        rowid;
+    '''
+
+fetch_all_program_courses = '''
+    SELECT 
+        program_courses.program_name, 
+        program_courses.semester, 
+        program_courses.course_code
+    FROM 
+        program_courses
+    JOIN 
+        courses
+    ON 
+        program_courses.course_code = courses.course_code
+    ORDER BY 
+        courses.course_title;
+    '''
+
+fetch_all_study_plan_slots = '''
+    SELECT 
+        program_name, 
+        semester, 
+        course_code, 
+        credit_hours
+    FROM 
+        study_plan_slots
+    ORDER BY 
+        program_name, semester, slot;
+    '''
+
+# Students of a program, identified by their section prefix
+audit_cohort = '''
+    SELECT 
+        s.roll_no, 
+        s.name, 
+        s.section
+    FROM 
+        students s
+    JOIN 
+        section_programs sp
+    ON 
+        sp.section_prefix = substr(s.section, 1, instr(s.section, '-') - 1)
+    WHERE 
+        sp.program_name = ?
+    ORDER BY 
+        s.roll_no;
+    '''
+
+# Every graded course of a program's students with its outcome
+audit_cohort_grades = '''
+    SELECT 
+        s.roll_no, 
+        g.course_code, 
+        gp.outcome
+    FROM 
+        students s
+    JOIN 
+        section_programs sp
+    ON 
+        sp.section_prefix = substr(s.section, 1, instr(s.section, '-') - 1)
+    JOIN 
+        grades g
+    ON 
+        g.roll_no = s.roll_no
+    JOIN 
+        grade_points gp
+    ON 
+        gp.grade = g.grade
+    WHERE 
+        sp.program_name = ?;
+    '''
+
+get_degree_audit_run = '''
+    SELECT catalog_version, grades_version, credit_load
+    FROM degree_audit_runs
+    WHERE program_name = ?;
+    '''
+
+fetch_degree_audits = '''
+    SELECT 
+        roll_no, 
+        name, 
+        section, 
+        current_semester, 
+        outstanding_courses, 
+        outstanding_labs, 
+        outstanding_electives, 
+        remaining_credit_hours, 
+        projected_graduation_semester
+    FROM 
+        degree_audits
+    WHERE 
+        program_name = ?
+    ORDER BY 
+        roll_no;
+    '''
+
+# Students added or replaced since the given rowid; INSERT OR REPLACE
+# gives replaced students a new rowid
+fetch_students_since = '''
+    SELECT rowid, roll_no, name, section
+    FROM students
+    WHERE rowid > ?
+    ORDER BY rowid;
+    '''
+
+get_student_index_state = '''
+    SELECT COUNT(*), COALESCE(MAX(rowid), 0) FROM students;
+    '''
+
+# A student's current grades with their study plan semester, in one indexed lookup
+fetch_transcript = '''
+    SELECT 
+        (
+            SELECT MIN(pc.semester)
+            FROM program_courses pc
+            WHERE pc.program_name = sp.program_name
+            AND pc.course_code = g.course_code
+        ) AS semester, 
+        g.course_code, 
+        c.course_title, 
+        c.credit_hours, 
+        g.grade
+    FROM 
+        students s
+    JOIN 
+        grades g
+    ON 
+        g.roll_no = s.roll_no
+    LEFT JOIN 
+        courses c
+    ON 
+        c.course_code = g.course_code
+    LEFT JOIN 
+        section_programs sp
+    ON 
+        sp.section_prefix = substr(s.section, 1, instr(s.section, '-') - 1)
+    WHERE 
+        s.roll_no = ?
+    ORDER BY 
+        semester IS NULL, 
+        semester, 
+        g.course_code;
+    '''
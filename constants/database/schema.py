@@ -27,6 +27,29 @@ CREATE TABLE IF NOT EXISTS program_courses (
 )
 '''
 
+# Every row of a program's study plan in order, so repeated elective slots
+# such as two SExxxx in one semester keep their count and credit hours
+CREATE_TABLE_STUDY_PLAN_SLOTS = '''
+CREATE TABLE IF NOT EXISTS study_plan_slots (
+    program_name TEXT NOT NULL,
+    semester INTEGER NOT NULL,
+    slot INTEGER NOT NULL,
+    course_code TEXT NOT NULL,
+    credit_hours INTEGER NOT NULL,
+    PRIMARY KEY (program_name, semester, slot)
+)
+'''
+
+CREATE_INDEX_STUDENTS_NAME = '''
+CREATE INDEX IF NOT EXISTS idx_students_name
+ON students (name)
+'''
+
+CREATE_INDEX_STUDENTS_SECTION = '''
+CREATE INDEX IF NOT EXISTS idx_students_section
+ON students (section)
+'''
+
 #? Range of student warnings
 CREATE_TABLE_STUDENTS = '''
 CREATE TABLE IF NOT EXISTS students (
@@ -52,3 +75,337 @@ CREATE TABLE IF NOT EXISTS grades (
     FOREIGN KEY (course_code) REFERENCES courses (course_code)
 )
 '''
+
+
+# Versioned per-batch catalogs. Identical course definitions are stored once,
+# keyed by a hash of their contents, and referenced by every batch using them.
+CREATE_TABLE_CATALOGS = '''
+CREATE TABLE IF NOT EXISTS catalogs (
+    batch TEXT PRIMARY KEY
+)
+'''
+
+CREATE_TABLE_COURSE_DEFINITIONS = '''
+CREATE TABLE IF NOT EXISTS course_definitions (
+    definition_id TEXT PRIMARY KEY,
+    course_code TEXT NOT NULL,
+    course_title TEXT NOT NULL,
+    credit_hours INTEGER NOT NULL,
+    prerequisite_course_code TEXT
+)
+'''
+
+CREATE_TABLE_CATALOG_COURSES = '''
+CREATE TABLE IF NOT EXISTS catalog_courses (
+    batch TEXT NOT NULL,
+    program_name TEXT NOT NULL,
+    course_code TEXT NOT NULL,
+    semester INTEGER NOT NULL,
+    definition_id TEXT NOT NULL,
+    PRIMARY KEY (batch, program_name, course_code, semester),
+    FOREIGN KEY (batch) REFERENCES catalogs (batch) DEFERRABLE INITIALLY DEFERRED,
+    FOREIGN KEY (definition_id) REFERENCES course_definitions (definition_id) DEFERRABLE INITIALLY DEFERRED
+) WITHOUT ROWID
+'''
+
+CREATE_INDEX_CATALOG_COURSES_CODE = '''
+CREATE INDEX IF NOT EXISTS idx_catalog_courses_code
+ON catalog_courses (batch, course_code)
+'''
+
+CREATE_INDEX_CATALOG_COURSES_DEFINITION = '''
+CREATE INDEX IF NOT EXISTS idx_catalog_courses_definition
+ON catalog_courses (definition_id)
+'''
+
+
+# Grading scheme and section-to-program lookup used by the grade statistics
+CREATE_TABLE_GRADE_POINTS = '''
+CREATE TABLE IF NOT EXISTS grade_points (
+    grade TEXT PRIMARY KEY,
+    points REAL,
+    outcome TEXT NOT NULL CHECK (outcome IN ('pass', 'fail', 'withdraw', 'incomplete'))
+)
+'''
+
+CREATE_TABLE_SECTION_PROGRAMS = '''
+CREATE TABLE IF NOT EXISTS section_programs (
+    section_prefix TEXT PRIMARY KEY,
+    program_name TEXT NOT NULL
+)
+'''
+
+# Materialized grade distributions, one row per grade.
+# Kept up to date by the triggers below; see grade_statistics.py.
+CREATE_TABLE_COURSE_GRADE_STATS = '''
+CREATE TABLE IF NOT EXISTS course_grade_stats (
+    course_code TEXT NOT NULL,
+    grade TEXT NOT NULL,
+    students INTEGER NOT NULL,
+    PRIMARY KEY (course_code, grade)
+) WITHOUT ROWID
+'''
+
+CREATE_TABLE_SECTION_GRADE_STATS = '''
+CREATE TABLE IF NOT EXISTS section_grade_stats (
+    section TEXT NOT NULL,
+    course_code TEXT NOT NULL,
+    grade TEXT NOT NULL,
+    students INTEGER NOT NULL,
+    PRIMARY KEY (section, course_code, grade)
+) WITHOUT ROWID
+'''
+
+CREATE_TABLE_PROGRAM_GRADE_STATS = '''
+CREATE TABLE IF NOT EXISTS program_grade_stats (
+    program_name TEXT NOT NULL,
+    course_code TEXT NOT NULL,
+    grade TEXT NOT NULL,
+    students INTEGER NOT NULL,
+    PRIMARY KEY (program_name, course_code, grade)
+) WITHOUT ROWID
+'''
+
+CREATE_TRIGGER_GRADES_INSERT_STATS = '''
+CREATE TRIGGER IF NOT EXISTS grades_insert_stats
+AFTER INSERT ON grades
+BEGIN
+    INSERT INTO course_grade_stats (course_code, grade, students)
+    VALUES (NEW.course_code, NEW.grade, 1)
+    ON CONFLICT (course_code, grade) DO UPDATE SET students = students + 1;
+
+    INSERT INTO section_grade_stats (section, course_code, grade, students)
+    SELECT s.section, NEW.course_code, NEW.grade, 1
+    FROM students s
+    WHERE s.roll_no = NEW.roll_no
+    ON CONFLICT (section, course_code, grade) DO UPDATE SET students = students + 1;
+
+    INSERT INTO program_grade_stats (program_name, course_code, grade, students)
+    SELECT sp.program_name, NEW.course_code, NEW.grade, 1
+    FROM students s
+    JOIN section_programs sp
+    ON sp.section_prefix = substr(s.section, 1, instr(s.section, '-') - 1)
+    WHERE s.roll_no = NEW.roll_no
+    ON CONFLICT (program_name, course_code, grade) DO UPDATE SET students = students + 1;
+END
+'''
+
+CREATE_TRIGGER_GRADES_DELETE_STATS = '''
+CREATE TRIGGER IF NOT EXISTS grades_delete_stats
+AFTER DELETE ON grades
+BEGIN
+    UPDATE course_grade_stats SET students = students - 1
+    WHERE course_code = OLD.course_code AND grade = OLD.grade;
+
+    UPDATE section_grade_stats SET students = students - 1
+    WHERE course_code = OLD.course_code AND grade = OLD.grade
+    AND section = (SELECT section FROM students WHERE roll_no = OLD.roll_no);
+
+    UPDATE program_grade_stats SET students = students - 1
+    WHERE course_code = OLD.course_code AND grade = OLD.grade
+    AND program_name = (
+        SELECT sp.program_name
+        FROM students s
+        JOIN section_programs sp
+        ON sp.section_prefix = substr(s.section, 1, instr(s.section, '-') - 1)
+        WHERE s.roll_no = OLD.roll_no
+    );
+END
+'''
+
+CREATE_TRIGGER_GRADES_UPDATE_STATS = '''
+CREATE TRIGGER IF NOT EXISTS grades_update_stats
+AFTER UPDATE OF roll_no, course_code, grade ON grades
+BEGIN
+    UPDATE course_grade_stats SET students = students - 1
+    WHERE course_code = OLD.course_code AND grade = OLD.grade;
+
+    UPDATE section_grade_stats SET students = students - 1
+    WHERE course_code = OLD.course_code AND grade = OLD.grade
+    AND section = (SELECT section FROM students WHERE roll_no = OLD.roll_no);
+
+    UPDATE program_grade_stats SET students = students - 1
+    WHERE course_code = OLD.course_code AND grade = OLD.grade
+    AND program_name = (
+        SELECT sp.program_name
+        FROM students s
+        JOIN section_programs sp
+        ON sp.section_prefix = substr(s.section, 1, instr(s.section, '-') - 1)
+        WHERE s.roll_no = OLD.roll_no
+    );
+
+    INSERT INTO course_grade_stats (course_code, grade, students)
+    VALUES (NEW.course_code, NEW.grade, 1)
+    ON CONFLICT (course_code, grade) DO UPDATE SET students = students + 1;
+
+    INSERT INTO section_grade_stats (section, course_code, grade, students)
+    SELECT s.section, NEW.course_code, NEW.grade, 1
+    FROM students s
+    WHERE s.roll_no = NEW.roll_no
+    ON CONFLICT (section, course_code, grade) DO UPDATE SET students = students + 1;
+
+    INSERT INTO program_grade_stats (program_name, course_code, grade, students)
+    SELECT sp.program_name, NEW.course_code, NEW.grade, 1
+    FROM students s
+    JOIN section_programs sp
+    ON sp.section_prefix = substr(s.section, 1, instr(s.section, '-') - 1)
+    WHERE s.roll_no = NEW.roll_no
+    ON CONFLICT (program_name, course_code, grade) DO UPDATE SET students = students + 1;
+END
+'''
+
+# INSERT OR REPLACE into students does not fire delete triggers, so a student
+# moving section has their existing grades moved between section and program
+# stats before the row is replaced
+CREATE_TRIGGER_STUDENTS_SECTION_STATS = '''
+CREATE TRIGGER IF NOT EXISTS students_section_stats
+BEFORE INSERT ON students
+WHEN EXISTS (
+    SELECT 1 FROM students WHERE roll_no = NEW.roll_no AND section <> NEW.section
+)
+BEGIN
+    UPDATE section_grade_stats SET students = students - (
+        SELECT COUNT(*) FROM grades g
+        WHERE g.roll_no = NEW.roll_no
+        AND g.course_code = section_grade_stats.course_code
+        AND g.grade = section_grade_stats.grade
+    )
+    WHERE section = (SELECT section FROM students WHERE roll_no = NEW.roll_no);
+
+    UPDATE program_grade_stats SET students = students - (
+        SELECT COUNT(*) FROM grades g
+        WHERE g.roll_no = NEW.roll_no
+        AND g.course_code = program_grade_stats.course_code
+        AND g.grade = program_grade_stats.grade
+    )
+    WHERE program_name = (
+        SELECT sp.program_name
+        FROM students s
+        JOIN section_programs sp
+        ON sp.section_prefix = substr(s.section, 1, instr(s.section, '-') - 1)
+        WHERE s.roll_no = NEW.roll_no
+    );
+
+    INSERT INTO section_grade_stats (section, course_code, grade, students)
+    SELECT NEW.section, g.course_code, g.grade, 1
+    FROM grades g
+    WHERE g.roll_no = NEW.roll_no
+    ON CONFLICT (section, course_code, grade) DO UPDATE SET students = students + 1;
+
+    INSERT INTO program_grade_stats (program_name, course_code, grade, students)
+    SELECT sp.program_name, g.course_code, g.grade, 1
+    FROM grades g
+    JOIN section_programs sp
+    ON sp.section_prefix = substr(NEW.section, 1, instr(NEW.section, '-') - 1)
+    WHERE g.roll_no = NEW.roll_no
+    ON CONFLICT (program_name, course_code, grade) DO UPDATE SET students = students + 1;
+END
+'''
+
+
+# Append-only history of every grade received, one row per attempt.
+# `grades` holds the latest attempt per course and is kept current by the
+# trigger below, so existing queries against it keep working.
+CREATE_TABLE_GRADE_SOURCES = '''
+CREATE TABLE IF NOT EXISTS grade_sources (
+    source_id INTEGER PRIMARY KEY,
+    source_name TEXT NOT NULL,
+    imported_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+'''
+
+# grade_sources used to be keyed by source name, which merged every import
+# of the same file (or of stdin) into one source
+MIGRATE_GRADE_SOURCES = (
+    '''
+    CREATE TABLE grade_sources_migrated (
+        source_id INTEGER PRIMARY KEY,
+        source_name TEXT NOT NULL,
+        imported_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    '''
+    INSERT INTO grade_sources_migrated (source_id, source_name, imported_at)
+    SELECT source_id, source_name, imported_at FROM grade_sources
+    ''',
+    'DROP TABLE grade_sources',
+    'ALTER TABLE grade_sources_migrated RENAME TO grade_sources',
+)
+
+#? Terms must sort chronologically as text, e.g. '2024-1' (Spring), '2024-2' (Fall)
+CREATE_TABLE_GRADE_ATTEMPTS = '''
+CREATE TABLE IF NOT EXISTS grade_attempts (
+    attempt_id INTEGER PRIMARY KEY,
+    roll_no TEXT NOT NULL,
+    course_code TEXT NOT NULL,
+    grade TEXT NOT NULL,
+    term TEXT NOT NULL DEFAULT '',
+    source_id INTEGER NOT NULL,
+    UNIQUE (roll_no, course_code, term, source_id),
+    FOREIGN KEY (source_id) REFERENCES grade_sources (source_id)
+)
+'''
+
+# An attempt becomes the current grade unless a later term is already recorded
+CREATE_TRIGGER_GRADE_ATTEMPTS_CURRENT = '''
+CREATE TRIGGER IF NOT EXISTS grade_attempts_current
+AFTER INSERT ON grade_attempts
+WHEN NOT EXISTS (
+    SELECT 1 FROM grade_attempts a
+    WHERE a.roll_no = NEW.roll_no
+    AND a.course_code = NEW.course_code
+    AND a.term > NEW.term
+)
+BEGIN
+    INSERT INTO grades (roll_no, course_code, grade)
+    VALUES (NEW.roll_no, NEW.course_code, NEW.grade)
+    ON CONFLICT (roll_no, course_code) DO UPDATE SET grade = excluded.grade
+    WHERE grade <> excluded.grade;
+END
+'''
+
+
+# Version stamps bumped by triggers whenever the data they cover changes,
+# so cached snapshots (e.g. the course catalog) can tell they are stale
+CREATE_TABLE_DATA_VERSIONS = '''
+CREATE TABLE IF NOT EXISTS data_versions (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+)
+'''
+
+data_version_trigger_template = '''
+CREATE TRIGGER IF NOT EXISTS {table}_{event}_{name}_version
+AFTER {event} ON {table}
+BEGIN
+    UPDATE data_versions SET version = version + 1 WHERE name = '{name}';
+END
+'''
+
+
+# Cached degree audits, valid while the catalog and grades versions they
+# were computed from are current
+CREATE_TABLE_DEGREE_AUDIT_RUNS = '''
+CREATE TABLE IF NOT EXISTS degree_audit_runs (
+    program_name TEXT PRIMARY KEY,
+    catalog_version INTEGER NOT NULL,
+    grades_version INTEGER NOT NULL,
+    credit_load INTEGER NOT NULL
+)
+'''
+
+CREATE_TABLE_DEGREE_AUDITS = '''
+CREATE TABLE IF NOT EXISTS degree_audits (
+    program_name TEXT NOT NULL,
+    roll_no TEXT NOT NULL,
+    name TEXT NOT NULL,
+    section TEXT NOT NULL,
+    current_semester INTEGER NOT NULL,
+    outstanding_courses TEXT NOT NULL,
+    outstanding_labs TEXT NOT NULL,
+    outstanding_electives INTEGER NOT NULL,
+    remaining_credit_hours INTEGER NOT NULL,
+    projected_graduation_semester INTEGER NOT NULL,
+    PRIMARY KEY (program_name, roll_no)
+) WITHOUT ROWID
+'''
@@ -0,0 +1,49 @@
+# Grading Scheme Constants
+
+# Grade points awarded for each letter grade
+GRADE_POINTS = {
+    'A+': 4.00,
+    'A': 4.00,
+    'A-': 3.67,
+    'B+': 3.33,
+    'B': 3.00,
+    'B-': 2.67,
+    'C+': 2.33,
+    'C': 2.00,
+    'C-': 1.67,
+    'D+': 1.33,
+    'D': 1.00,
+    'F': 0.00,
+    'FA': 0.00,  # Failed due to attendance
+}
+
+PASSING_GRADES = ('A+', 'A', 'A-', 'B+', 'B', 'B-', 'C+', 'C', 'C-', 'D+', 'D', 'S')
+FAILING_GRADES = ('F', 'FA')
+WITHDRAWN_GRADES = ('W',)
+INCOMPLETE_GRADES = ('I',)
+
+# Outcome of each grade: pass, fail, withdraw or incomplete
+GRADE_OUTCOMES = {
+    **{grade: 'pass' for grade in PASSING_GRADES},
+    **{grade: 'fail' for grade in FAILING_GRADES},
+    **{grade: 'withdraw' for grade in WITHDRAWN_GRADES},
+    **{grade: 'incomplete' for grade in INCOMPLETE_GRADES},
+}
+
+# Programs by section prefix (e.g. 'BSE' in 'BSE-223A'), seeded into an empty
+# section_programs table; the table is authoritative afterwards
+SECTION_PROGRAMS = {
+    'BAI': 'Artificial Intelligence',
+    'BCS': 'Computer Science',
+    'BCY': 'Cyber Security',
+    'BDS': 'Data Science',
+    'BSE': 'Software Engineering',
+}
+
+# Study plan slots that any course can fill, recognised by a word in their
+# title (e.g. 'SE Elective - I', 'SE Supporting Course-1', 'SS/MG Elective-II').
+# Placeholder codes alone are not enough: 'CSxxxx Computing Internship' is required.
+ELECTIVE_SLOT_TITLES = ('Elective', 'Supporting')
+
+# Credit hours a student can take in a regular semester
+SEMESTER_CREDIT_LOAD = 18
@@ -0,0 +1,169 @@
+import os
+import pickle
+import sqlite3
+import logging
+from dataclasses import replace
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from catalog_core import CATALOG_VERSION, Course, initialize_catalog_versions
+from constants.database import config
+from constants.database import queries
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_SUFFIX = '.catalog.pickle'
+
+class CourseCatalog:
+    """
+    Immutable, indexed view of the courses table.
+
+    Built once per catalog version and shared by every component in the
+    process; courses are frozen ``catalog_core.Course`` records. Study plans
+    list every slot of a program in order, with the slot's credit hours, and
+    are empty for programs loaded before study plan slots were stored.
+    ``courses`` holds the latest definition of each code; batch catalogs keep
+    the definitions each batch was loaded with.
+    """
+    __slots__ = ('version', 'courses', 'by_code', 'by_title', 'by_program_semester',
+                 'study_plan_slots', 'study_plans', 'batch_courses', 'by_batch')
+
+    def __init__(self, version: int, courses: List[Course],
+                 offerings: List[Tuple[str, int, str]],
+                 study_plan_slots: List[Tuple[str, int, str, int]],
+                 batch_courses: List[Tuple[str, str, str, int, Optional[str]]]):
+        by_code: Dict[str, Course] = {course.course_code: course for course in courses}
+        by_title: Dict[str, Course] = {}
+        for course in courses:
+            # First match wins, as with the GUI's fetchone() on course_title
+            by_title.setdefault(course.course_title, course)
+        by_program_semester: Dict[Tuple[str, int], List[Course]] = {}
+        for program_name, semester, course_code in offerings:
+            by_program_semester.setdefault((program_name, semester), []).append(by_code[course_code])
+
+        study_plans: Dict[str, List[Tuple[int, Course]]] = {}
+        for program_name, semester, course_code, credit_hours in study_plan_slots:
+            course = replace(by_code[course_code], credit_hours=credit_hours)
+            study_plans.setdefault(program_name, []).append((semester, course))
+
+        by_batch: Dict[str, Dict[str, Course]] = {}
+        for batch, *definition in batch_courses:
+            course = Course(*definition)
+            by_batch.setdefault(batch, {})[course.course_code] = course
+
+        self.version = version
+        self.courses = tuple(courses)
+        self.by_code: Mapping[str, Course] = MappingProxyType(by_code)
+        self.by_title: Mapping[str, Course] = MappingProxyType(by_title)
+        self.by_program_semester: Mapping[Tuple[str, int], Tuple[Course, ...]] = MappingProxyType({
+            key: tuple(value) for key, value in by_program_semester.items()
+        })
+        self.batch_courses = tuple(batch_courses)
+        self.by_batch: Mapping[str, Mapping[str, Course]] = MappingProxyType({
+            batch: MappingProxyType(by_code) for batch, by_code in by_batch.items()
+        })
+        self.study_plan_slots = tuple(study_plan_slots)
+        self.study_plans: Mapping[str, Tuple[Tuple[int, Course], ...]] = MappingProxyType({
+            key: tuple(value) for key, value in study_plans.items()
+        })
+
+    def __len__(self) -> int:
+        return len(self.courses)
+
+    def __contains__(self, course_code: str) -> bool:
+        return course_code in self.by_code
+
+    def __reduce__(self):
+        offerings = [
+            (program_name, semester, course.course_code)
+            for (program_name, semester), courses in self.by_program_semester.items()
+            for course in courses
+        ]
+        return CourseCatalog, (self.version, list(self.courses), offerings,
+                               list(self.study_plan_slots), list(self.batch_courses))
+
+    def get(self, course_code: str) -> Optional[Course]:
+        return self.by_code.get(course_code)
+
+    def prerequisite(self, course_title: str) -> Optional[str]:
+        """Returns the prerequisite code of the course with the given title."""
+        course = self.by_title.get(course_title)
+        return course.prerequisite_course_code if course else None
+
+    def for_batch(self, batch: Optional[str]) -> Mapping[str, Course]:
+        """Returns a batch's courses by code, or the latest definitions if it has no catalog."""
+        return self.by_batch.get(batch, self.by_code) if batch is not None else self.by_code
+
+    def study_plan(self, program_name: str) -> Tuple[Tuple[int, Course], ...]:
+        """Returns (semester, course) of every slot of a program's study plan, in order."""
+        return self.study_plans.get(program_name, ())
+
+    def offerings(self, program_name: str, semester: int) -> Tuple[Course, ...]:
+        """Returns a program's courses in a semester, ordered by title."""
+        return self.by_program_semester.get((program_name, semester), ())
+
+def _catalog_version(conn: sqlite3.Connection) -> int:
+    try:
+        row = conn.execute(queries.get_data_version, (CATALOG_VERSION,)).fetchone()
+    except sqlite3.OperationalError:
+        row = None
+    if row is None:
+        # Databases created before version stamps get them on first use
+        initialize_catalog_versions(conn)
+        conn.commit()
+        row = conn.execute(queries.get_data_version, (CATALOG_VERSION,)).fetchone()
+    return row[0]
+
+def _load_snapshot(path: str, version: int) -> Optional[CourseCatalog]:
+    try:
+        with open(path, 'rb') as file:
+            catalog = pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError):
+        return None
+    if not isinstance(catalog, CourseCatalog) or catalog.version != version:
+        return None
+    return catalog
+
+def _write_snapshot(path: str, catalog: CourseCatalog) -> None:
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, 'wb') as file:
+            pickle.dump(catalog, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+    except OSError as e:
+        logger.warning(f"Could not write catalog snapshot '{path}': {e}")
+
+_catalogs: Dict[str, CourseCatalog] = {}
+
+def get_catalog(db_path: str = config.DB_NAME) -> CourseCatalog:
+    """
+    Returns the shared course catalog of a database.
+
+    The catalog is kept in memory per database and persisted next to it as a
+    pickled snapshot, so later processes skip the SQL load. Both are reused
+    until the catalog version stamp changes.
+    """
+    key = os.path.abspath(db_path)
+    with sqlite3.connect(db_path) as conn:
+        version = _catalog_version(conn)
+
+        catalog = _catalogs.get(key)
+        if catalog is not None and catalog.version == version:
+            return catalog
+
+        snapshot_path = f"{db_path}{SNAPSHOT_SUFFIX}"
+        catalog = _load_snapshot(snapshot_path, version)
+        if catalog is None:
+            courses = [Course(*row) for row in conn.execute(queries.fetch_all_courses)]
+            offerings = conn.execute(queries.fetch_all_program_courses).fetchall()
+            try:
+                study_plan_slots = conn.execute(queries.fetch_all_study_plan_slots).fetchall()
+                batch_courses = conn.execute(queries.fetch_all_catalog_courses).fetchall()
+            except sqlite3.OperationalError:
+                study_plan_slots, batch_courses = [], []  # Created by the next catalog load
+            catalog = CourseCatalog(version, courses, offerings, study_plan_slots, batch_courses)
+            _write_snapshot(snapshot_path, catalog)
+            logger.info(f"Loaded {len(catalog)} courses into catalog version {version}")
+
+    _catalogs[key] = catalog
+    return catalog
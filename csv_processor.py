@@ -1,70 +1,109 @@
+import re
 import csv
+import sys
 import logging
-from typing import List, Tuple
-from prospectus_processor import CourseProcessor, Course
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+from catalog_core import CatalogWriter, Course, append_courses_and_labs
+from input_streams import Source, open_text
 
 from constants.database.config import DB_NAME
 
+# Codes appear as 'CS 1002' or 'CS1002', prerequisites as 'CS 1002 Programming Fundamentals'
+COURSE_CODE_PATTERN = re.compile(r'\b([A-Z]{2})\s?(\d{4})\b')
+
+def extract_course_code(text: str) -> Optional[str]:
+    """Returns the first course code in the text without its space, e.g. CS1002, or None."""
+    match = COURSE_CODE_PATTERN.search(text)
+    return match.group(1) + match.group(2) if match else None
 
 class CSVProcessor:
-    def __init__(self, csv_path: str, db_path: str):
+    def __init__(self, csv_path: Source, db_path: str):
         self.csv_path = csv_path
-        self.processor = CourseProcessor(pdf_path=None)  # Initialize the CourseProcessor
-        self.processor.db_path = db_path  # Set the database path
+        self.writer = CatalogWriter(db_path)
         self.logger = logging.getLogger(__name__)
 
     def parse_csv(self) -> List[Tuple[Course, str, int]]:
         """
         Parses the CSV file and prepares the courses list using append_courses_and_labs.
         """
-        courses = []
+        return [course for courses in self.parse_catalogs().values() for course in courses]
+
+    def parse_catalogs(self) -> Dict[str, List[Tuple[Course, str, int]]]:
+        """
+        Parses the CSV file into one courses list per batch.
+        """
+        catalogs: Dict[str, List[Tuple[Course, str, int]]] = {}
 
-        with open(self.csv_path, mode="r") as csvfile:
+        with open_text(self.csv_path) as csvfile:
             reader = csv.DictReader(csvfile)
             for row in reader:
+                batch = row["Batch"].strip()
                 program_name = row["Program"]
                 semester = int(row["Semester"])
-                course_code = row["Course Code"]
+                course_code = extract_course_code(row["Course Code"]) or row["Course Code"].strip()
                 course_title = row["Course Title"]
 
                 # Parse credit hours
                 credit_hours_class, credit_hours_lab = map(int, row["Credits (Theory + Lab)"].split("+"))
 
-                # Handle prerequisite
-                prereq = row["Prerequisite"] if row["Prerequisite"] != "None" else None
+                # Handle prerequisite; notes such as 'Note 1' name no course
+                prereq_text = row["Prerequisite"].strip()
+                prereq = extract_course_code(prereq_text)
+                if prereq is None and prereq_text not in ("", "None"):
+                    self.logger.warning(
+                        f"Ignoring unrecognized prerequisite '{prereq_text}' of {course_code} in batch {batch}"
+                    )
 
-                # Use append_courses_and_labs from CourseProcessor
-                print(
-                    # courses,
-                    course_code,
-                    course_title,
-                    credit_hours_class,
-                    credit_hours_lab,
-                    prereq,
-                    program_name,
-                    semester,
+                # Use the shared append_courses_and_labs from the catalog core
+                self.logger.debug(
+                    f"Parsed {course_code} {course_title} ({credit_hours_class}+{credit_hours_lab}, "
+                    f"prerequisite {prereq}) for {program_name} semester {semester}"
                 )
-                CourseProcessor.append_courses_and_labs(
-                    courses,
-                    course_code.strip(),
+                append_courses_and_labs(
+                    catalogs.setdefault(batch, []),
+                    course_code,
                     course_title.strip(),
                     credit_hours_class,
                     credit_hours_lab,
-                    prereq.strip() if prereq else prereq,
+                    prereq,
                     program_name.strip(),
                     semester,
                 )
 
-        self.logger.info(f"Parsed {len(courses)} courses from CSV.")
-        return courses
+        for batch, courses in catalogs.items():
+            catalogs[batch] = self._drop_unknown_prerequisites(batch, courses)
+
+        total = sum(len(courses) for courses in catalogs.values())
+        self.logger.info(f"Parsed {total} courses for {len(catalogs)} batches from CSV.")
+        return catalogs
+
+    def _drop_unknown_prerequisites(self, batch: str,
+                                    courses: List[Tuple[Course, str, int]]) -> List[Tuple[Course, str, int]]:
+        """Clears prerequisites naming no course of the batch, which would fail the foreign key."""
+        codes = {course.course_code for course, _, _ in courses}
+        resolved = []
+        for course, program_name, semester in courses:
+            prereq = course.prerequisite_course_code
+            if prereq is not None and prereq not in codes:
+                self.logger.warning(
+                    f"Ignoring prerequisite {prereq} of {course.course_code} in batch {batch}: not in its catalog"
+                )
+                course = replace(course, prerequisite_course_code=None)
+            resolved.append((course, program_name, semester))
+        return resolved
 
     def insert_csv_data(self):
         """
-        Parses the CSV and delegates the insertion to CourseProcessor's insert_courses.
+        Parses the CSV and delegates the insertion to CatalogWriter's insert_courses.
+        Batches are loaded oldest first so the latest catalog wins in ``courses``;
+        every batch's own definitions stay in its catalog.
         """
         try:
-            courses = self.parse_csv()
-            self.processor.insert_courses(courses)  # Leverage existing logic for database insertion
+            catalogs = self.parse_catalogs()
+            for batch in sorted(catalogs):
+                # Leverage existing logic for database insertion
+                self.writer.insert_courses(catalogs[batch], batch=batch)
             self.logger.info("CSV data successfully inserted into the database.")
         except Exception as e:
             self.logger.error(f"Failed to insert CSV data: {e}")
@@ -82,7 +121,8 @@ if __name__ == "__main__":
     )
 
     # Define the paths for the CSV file and the database
-    csv_path = "data.csv"  # Replace with the actual path to your CSV file
+    # CSV path (optionally gzip/zstd-compressed), or '-' to read from stdin
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else "data.csv"
     db_path = DB_NAME  # Replace with the actual path to your database
 
     # Initialize and process the CSV
@@ -0,0 +1,263 @@
+import csv
+import math
+import sqlite3
+import logging
+import argparse
+from dataclasses import dataclass
+from typing import Dict, List, Set, Tuple
+
+from constants import grading
+from constants.database import schema
+from constants.database import queries
+from constants.database import insertions
+from constants.database.config import DB_NAME
+from catalog_core import CATALOG_VERSION, Course, is_lab
+from course_catalog import get_catalog
+from grade_processor import GRADES_VERSION
+
+logger = logging.getLogger(__name__)
+
+# Created by grade imports; the audit only reads them
+STUDENT_TABLES = ('students', 'grades', 'grade_points', 'section_programs')
+
+@dataclass
+class DegreeAuditResult:
+    """What a student still needs to complete their program."""
+    roll_no: str
+    name: str
+    section: str
+    current_semester: int  # latest study plan semester with a graded course
+    outstanding_courses: Tuple[str, ...]  # required course codes, labs included
+    outstanding_labs: Tuple[str, ...]
+    outstanding_electives: int  # elective slots not covered by extra courses
+    remaining_credit_hours: int
+    projected_graduation_semester: int
+
+def is_placeholder(course: Course) -> bool:
+    """Returns True for elective and supporting course slots that any course can fill."""
+    return any(word in course.course_title for word in grading.ELECTIVE_SLOT_TITLES)
+
+class DegreeAudit:
+    """
+    Audits every student of a program against its study plan at once.
+
+    The study plan comes from the shared course catalog and the cohort's
+    grades from a single query, so each student costs a few set operations.
+    Results are stored in degree_audits and reused until the catalog or
+    grades version changes.
+    """
+
+    def __init__(self, program_name: str, db_path: str = DB_NAME,
+                 credit_load: int = grading.SEMESTER_CREDIT_LOAD):
+        self.program_name = program_name
+        self.db_path = db_path
+        self.credit_load = credit_load
+        with sqlite3.connect(self.db_path) as conn:
+            self._check_student_schema(conn)
+            conn.execute(schema.CREATE_TABLE_DEGREE_AUDIT_RUNS)
+            conn.execute(schema.CREATE_TABLE_DEGREE_AUDITS)
+
+    def _check_student_schema(self, conn: sqlite3.Connection) -> None:
+        """Raises ValueError unless grades have been imported into the database."""
+        existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        missing = [table for table in STUDENT_TABLES + ('data_versions',) if table not in existing]
+        if not missing and conn.execute(queries.get_data_version, (GRADES_VERSION,)).fetchone() is None:
+            missing = [f"the '{GRADES_VERSION}' version stamp"]
+        if missing:
+            raise ValueError(
+                f"Database '{self.db_path}' has no student grades ({', '.join(missing)} missing); "
+                "import a grade sheet with grade_processor.py first"
+            )
+
+    def _study_plan(self) -> Tuple[Dict[str, Tuple[int, Course]], List[Tuple[int, Course]]]:
+        """
+        Returns the required courses by code and the elective slots, in plan order.
+
+        Study plans loaded before study_plan_slots existed only have
+        program_courses, which keeps one row per code and semester: repeated
+        elective slots collapse into one and share a single credit hour
+        value, so electives and remaining credit hours are undercounted
+        until the catalog is loaded again.
+        """
+        catalog = get_catalog(self.db_path)
+        slots = catalog.study_plan(self.program_name)
+        if not slots:
+            logger.warning(
+                f"No study plan slots stored for {self.program_name}; reload its catalog. "
+                "Elective slots and remaining credit hours are a lower bound."
+            )
+            slots = [
+                (semester, course)
+                for (program_name, semester), courses in sorted(catalog.by_program_semester.items())
+                if program_name == self.program_name
+                for course in courses
+            ]
+
+        required: Dict[str, Tuple[int, Course]] = {}
+        electives: List[Tuple[int, Course]] = []
+        for semester, course in slots:
+            if is_placeholder(course):
+                electives.append((semester, course))
+            else:
+                required.setdefault(course.course_code, (semester, course))
+        return required, electives
+
+    def _versions(self, conn: sqlite3.Connection) -> Tuple[int, int]:
+        get_catalog(self.db_path)  # Stamps databases created before catalog versions
+        catalog_version = conn.execute(queries.get_data_version, (CATALOG_VERSION,)).fetchone()[0]
+        grades_version = conn.execute(queries.get_data_version, (GRADES_VERSION,)).fetchone()[0]
+        return catalog_version, grades_version
+
+    def audit(self, refresh: bool = False) -> List[DegreeAuditResult]:
+        """
+        Returns the audit of every student in the program.
+
+        Args:
+            refresh: Recompute even if the cached audit is current.
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            versions = self._versions(conn)
+            run = conn.execute(queries.get_degree_audit_run, (self.program_name,)).fetchone()
+            if not refresh and run == versions + (self.credit_load,):
+                rows = conn.execute(queries.fetch_degree_audits, (self.program_name,)).fetchall()
+                logger.info(f"Using cached degree audit of {len(rows)} students in {self.program_name}")
+                return [self._from_row(row) for row in rows]
+
+            results = self._compute(conn)
+            conn.execute(insertions.DELETE_DEGREE_AUDITS, (self.program_name,))
+            conn.executemany(insertions.INSERT_DEGREE_AUDIT, [
+                (self.program_name, result.roll_no, result.name, result.section,
+                 result.current_semester, ",".join(result.outstanding_courses),
+                 ",".join(result.outstanding_labs), result.outstanding_electives,
+                 result.remaining_credit_hours, result.projected_graduation_semester)
+                for result in results
+            ])
+            conn.execute(insertions.INSERT_DEGREE_AUDIT_RUN, (self.program_name,) + versions + (self.credit_load,))
+            conn.commit()
+        logger.info(f"Audited {len(results)} students in {self.program_name}")
+        return results
+
+    @staticmethod
+    def _from_row(row: Tuple) -> DegreeAuditResult:
+        roll_no, name, section, current_semester, courses, labs, electives, remaining, graduation = row
+        return DegreeAuditResult(
+            roll_no, name, section, current_semester,
+            tuple(courses.split(",")) if courses else (),
+            tuple(labs.split(",")) if labs else (),
+            electives, remaining, graduation,
+        )
+
+    def _compute(self, conn: sqlite3.Connection) -> List[DegreeAuditResult]:
+        required, electives = self._study_plan()
+        catalog = get_catalog(self.db_path)
+        required_codes = set(required)
+
+        passed: Dict[str, Set[str]] = {}
+        attempted: Dict[str, Set[str]] = {}
+        for roll_no, course_code, outcome in conn.execute(queries.audit_cohort_grades, (self.program_name,)):
+            attempted.setdefault(roll_no, set()).add(course_code)
+            if outcome == 'pass':
+                passed.setdefault(roll_no, set()).add(course_code)
+
+        results = []
+        for roll_no, name, section in conn.execute(queries.audit_cohort, (self.program_name,)):
+            student_passed = passed.get(roll_no, set())
+            outstanding = required_codes - student_passed
+
+            # Passed courses outside the required list fill elective slots in plan order
+            extra_credit_hours = sum(
+                catalog.by_code[code].credit_hours
+                for code in student_passed - required_codes if code in catalog
+            )
+            open_electives = []
+            for semester, course in electives:
+                if extra_credit_hours >= course.credit_hours:
+                    extra_credit_hours -= course.credit_hours
+                else:
+                    open_electives.append(course)
+
+            remaining = (
+                sum(required[code][1].credit_hours for code in outstanding)
+                + sum(course.credit_hours for course in open_electives)
+            )
+            current_semester = max(
+                (required[code][0] for code in attempted.get(roll_no, ()) if code in required),
+                default=0,
+            )
+            ordered = sorted(outstanding, key=lambda code: (required[code][0], code))
+            results.append(DegreeAuditResult(
+                roll_no=roll_no,
+                name=name,
+                section=section,
+                current_semester=current_semester,
+                outstanding_courses=tuple(ordered),
+                outstanding_labs=tuple(code for code in ordered if is_lab(required[code][1])),
+                outstanding_electives=len(open_electives),
+                remaining_credit_hours=remaining,
+                projected_graduation_semester=current_semester + self._semesters_needed(
+                    outstanding, remaining, required
+                ),
+            ))
+        return results
+
+    def _semesters_needed(self, outstanding: Set[str], remaining: int,
+                          required: Dict[str, Tuple[int, Course]]) -> int:
+        """
+        Estimates the semesters left: enough to fit the remaining credit hours at
+        the semester load, and at least one per link of outstanding prerequisites.
+        """
+        if not remaining and not outstanding:
+            return 0
+        depths: Dict[str, int] = {}
+
+        def depth(code: str) -> int:
+            if code not in depths:
+                depths[code] = 1  # Guards against prerequisite cycles
+                prerequisite = required[code][1].prerequisite_course_code
+                if prerequisite in outstanding:
+                    depths[code] = 1 + depth(prerequisite)
+            return depths[code]
+
+        chain = max((depth(code) for code in outstanding), default=1)
+        return max(math.ceil(remaining / self.credit_load), chain)
+
+def export_audit_to_csv(results: List[DegreeAuditResult], path: str) -> None:
+    """Writes one row per student."""
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow([
+            "Roll No", "Name", "Section", "Current Semester", "Outstanding Courses",
+            "Outstanding Labs", "Outstanding Electives", "Remaining Credit Hours",
+            "Projected Graduation Semester",
+        ])
+        for result in results:
+            writer.writerow([
+                result.roll_no, result.name, result.section, result.current_semester,
+                " ".join(result.outstanding_courses), " ".join(result.outstanding_labs),
+                result.outstanding_electives, result.remaining_credit_hours,
+                result.projected_graduation_semester,
+            ])
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description="Audit a program's students against its study plan.")
+    parser.add_argument("program", help="Program name, e.g. 'Software Engineering'")
+    parser.add_argument("--credit-load", type=int, default=grading.SEMESTER_CREDIT_LOAD,
+                        help="Credit hours taken per semester when projecting graduation")
+    parser.add_argument("--refresh", action="store_true", help="Ignore the cached audit")
+    parser.add_argument("--csv", help="Export the audit to this file")
+    args = parser.parse_args()
+
+    results = DegreeAudit(args.program, credit_load=args.credit_load).audit(args.refresh)
+    for result in results:
+        print(
+            f"{result.roll_no} {result.name}: {len(result.outstanding_courses)} courses, "
+            f"{result.outstanding_electives} electives, {result.remaining_credit_hours} credit hours left, "
+            f"graduating after semester {result.projected_graduation_semester}"
+        )
+    if args.csv:
+        export_audit_to_csv(results, args.csv)
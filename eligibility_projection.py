@@ -0,0 +1,201 @@
+import math
+import sqlite3
+import logging
+import argparse
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from constants import grading
+from constants.database import queries
+from constants.database.config import DB_NAME, SECTION_CAPACITY
+from course_catalog import get_catalog
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class Scenario:
+    """Assumptions about grades that are not final yet."""
+    # (roll_no, course_code): assumed grade, e.g. an 'I' expected to become 'C'
+    assumed_grades: Dict[Tuple[str, str], str] = field(default_factory=dict)
+    # course_code: share of pending attempts expected to pass
+    pass_rates: Dict[str, float] = field(default_factory=dict)
+    default_pass_rate: float = 1.0
+
+    def pass_rate(self, course_code: str) -> float:
+        return self.pass_rates.get(course_code, self.default_pass_rate)
+
+@dataclass
+class ProjectedCourse:
+    """Projected demand for a next-semester course under a scenario."""
+    course_code: str
+    course_title: str
+    prerequisite_course_code: Optional[str]
+    eligible: int  # students certainly eligible
+    expected: float  # eligible students weighted by pass-rate assumptions
+    sections: int
+
+def _bitset(bits: Iterable[int], size: int) -> int:
+    """Packs bit positions into an integer bitset."""
+    buffer = bytearray((size + 7) // 8)
+    for bit in bits:
+        buffer[bit >> 3] |= 1 << (bit & 7)
+    return int.from_bytes(buffer, "little")
+
+class EligibilityProjection:
+    """
+    Projects next-semester eligibility for a program's cohort.
+
+    Unlike the GUI query, which lists students repeating a course, a student
+    is projected eligible for a course once they have passed its prerequisite
+    and have not yet passed the course itself. The cohort's grade state is
+    loaded once into per-course bitsets of passed and pending ('I') attempts,
+    so each scenario is evaluated with a handful of AND/popcount operations
+    per course instead of a query per student.
+    """
+
+    def __init__(self, program_name: str, db_path: str = DB_NAME,
+                 section_capacity: int = SECTION_CAPACITY,
+                 enrollment_statuses: Optional[Tuple[str, ...]] = ('Current',)):
+        self.program_name = program_name
+        self.db_path = db_path
+        self.section_capacity = section_capacity
+        self.enrollment_statuses = enrollment_statuses
+        self.roll_index: Dict[str, int] = {}
+        self.cohort = 0
+        self.passed: Dict[str, int] = {}
+        self.pending: Dict[str, int] = {}
+        self.load()
+
+    def load(self) -> None:
+        """Loads the cohort and its grades into bitsets."""
+        with sqlite3.connect(self.db_path) as conn:
+            prefixes = {
+                prefix for prefix, in conn.execute(queries.fetch_program_section_prefixes, (self.program_name,))
+            }
+            students = conn.execute(
+                "SELECT roll_no, section, enrollment_status FROM students ORDER BY roll_no"
+            ).fetchall()
+            grades = conn.execute("SELECT roll_no, course_code, grade FROM grades").fetchall()
+
+        cohort = [
+            roll_no for roll_no, section, status in students
+            if section.split('-', 1)[0] in prefixes
+            and (self.enrollment_statuses is None or status in self.enrollment_statuses)
+        ]
+        self.roll_index = {roll_no: index for index, roll_no in enumerate(cohort)}
+        size = len(self.roll_index)
+
+        passed: Dict[str, List[int]] = {}
+        pending: Dict[str, List[int]] = {}
+        for roll_no, course_code, grade in grades:
+            bit = self.roll_index.get(roll_no)
+            if bit is None:
+                continue
+            if grade in grading.PASSING_GRADES:
+                passed.setdefault(course_code, []).append(bit)
+            elif grade in grading.INCOMPLETE_GRADES:
+                pending.setdefault(course_code, []).append(bit)
+
+        self.cohort = (1 << size) - 1
+        self.passed = {code: _bitset(bits, size) for code, bits in passed.items()}
+        self.pending = {code: _bitset(bits, size) for code, bits in pending.items()}
+        logger.info(f"Loaded {size} students of {self.program_name} for projection")
+
+    def fetch_courses(self, semester: int) -> List[Tuple[str, str, Optional[str]]]:
+        """Returns (code, title, prerequisite) of the program's courses in a semester."""
+        return [
+            (course.course_code, course.course_title, course.prerequisite_course_code or None)
+            for course in get_catalog(self.db_path).offerings(self.program_name, semester)
+        ]
+
+    def _apply(self, scenario: Scenario) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Returns passed/pending bitsets with the scenario's assumed grades applied."""
+        if not scenario.assumed_grades:
+            return self.passed, self.pending
+        passed, pending = dict(self.passed), dict(self.pending)
+        for (roll_no, course_code), grade in scenario.assumed_grades.items():
+            bit = self.roll_index.get(roll_no)
+            if bit is None:
+                continue
+            mask = 1 << bit
+            pending[course_code] = pending.get(course_code, 0) & ~mask
+            if grade in grading.PASSING_GRADES:
+                passed[course_code] = passed.get(course_code, 0) | mask
+            else:
+                passed[course_code] = passed.get(course_code, 0) & ~mask
+                if grade in grading.INCOMPLETE_GRADES:
+                    pending[course_code] |= mask
+        return passed, pending
+
+    def project(self, semester: int, scenario: Optional[Scenario] = None,
+                courses: Optional[List[Tuple[str, str, Optional[str]]]] = None) -> List[ProjectedCourse]:
+        """
+        Projects eligibility and section counts for every course of a semester.
+
+        Args:
+            semester: The upcoming semester of the program's study plan.
+            scenario: Assumed grades and pass rates; defaults to every pending
+                attempt passing.
+            courses: Pre-fetched courses, to avoid a query when comparing
+                many scenarios.
+        """
+        scenario = scenario or Scenario()
+        passed, pending = self._apply(scenario)
+        courses = courses if courses is not None else self.fetch_courses(semester)
+
+        projections = []
+        for course_code, course_title, prereq in courses:
+            passed_course = passed.get(course_code, 0)
+            pending_course = pending.get(course_code, 0) & ~passed_course
+            still_needed = self.cohort & ~passed_course & ~pending_course
+
+            if prereq:
+                cleared = passed.get(prereq, 0)
+                clearing = pending.get(prereq, 0) & ~cleared
+                prereq_rate = scenario.pass_rate(prereq)
+            else:
+                cleared, clearing, prereq_rate = self.cohort, 0, 0.0
+            # Students pending in the course itself only need it if they fail
+            retake_rate = 1.0 - scenario.pass_rate(course_code)
+
+            eligible = (cleared & still_needed).bit_count()
+            expected = (
+                eligible
+                + prereq_rate * (clearing & still_needed).bit_count()
+                + retake_rate * (cleared & pending_course).bit_count()
+                + prereq_rate * retake_rate * (clearing & pending_course).bit_count()
+            )
+            projections.append(ProjectedCourse(
+                course_code=course_code,
+                course_title=course_title,
+                prerequisite_course_code=prereq,
+                eligible=eligible,
+                expected=expected,
+                sections=math.ceil(round(expected, 6) / self.section_capacity),
+            ))
+        return projections
+
+    def compare(self, semester: int, scenarios: Dict[str, Scenario]) -> Dict[str, List[ProjectedCourse]]:
+        """Projects the same semester under several named scenarios."""
+        courses = self.fetch_courses(semester)
+        return {name: self.project(semester, scenario, courses) for name, scenario in scenarios.items()}
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description="Project next-semester eligibility for a program.")
+    parser.add_argument("program", help="Program name, e.g. 'Software Engineering'")
+    parser.add_argument("semester", type=int, help="Upcoming semester of the study plan")
+    parser.add_argument("--pass-rate", type=float, default=1.0,
+                        help="Share of pending ('I') attempts assumed to pass")
+    args = parser.parse_args()
+
+    projection = EligibilityProjection(args.program)
+    for course in projection.project(args.semester, Scenario(default_pass_rate=args.pass_rate)):
+        print(
+            f"{course.course_code} {course.course_title}: {course.eligible} eligible, "
+            f"{course.expected:.1f} expected, {course.sections} sections"
+        )
@@ -1,28 +1,37 @@
+import io
+import os
 import csv
+import sys
+import mmap
+import itertools
 import sqlite3
 import logging
 from pathlib import Path
-from typing import List, Dict, Tuple, Set
+from typing import List, Dict, Mapping, Optional, Tuple, Set
 from dataclasses import dataclass
 
-from constants.database.schema import CREATE_TABLE_STUDENTS, CREATE_TABLE_GRADES
-from constants.database.insertions import INSERT_STUDENT, INSERT_GRADE
+from constants.database.schema import (
+    CREATE_TABLE_STUDENTS, CREATE_TABLE_GRADES, CREATE_TABLE_GRADE_SOURCES,
+    CREATE_TABLE_GRADE_ATTEMPTS, CREATE_TRIGGER_GRADE_ATTEMPTS_CURRENT,
+    CREATE_INDEX_STUDENTS_NAME, CREATE_INDEX_STUDENTS_SECTION, MIGRATE_GRADE_SOURCES
+)
+from constants.database.insertions import (
+    INSERT_STUDENT, INSERT_GRADE_SOURCE, DELETE_GRADE_SOURCE, INSERT_GRADE_ATTEMPT,
+    BACKFILL_GRADE_ATTEMPTS
+)
+from constants.database.queries import fetch_grade_history
 from constants.database.config import DB_NAME
+from input_streams import Source, is_plain_file, open_text
+from catalog_core import Course, initialize_data_versions, roll_no_batch
+from course_catalog import get_catalog
+from student_search import refresh_student_index
+from grade_statistics import initialize_grade_statistics
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
-@dataclass
-class Course:
-    """Data class to represent a course."""
-    code: str
-    title: str
-    credit_hours: int
-    prerequisite_code: str = None
+# Version stamp bumped whenever students or their current grades change
+GRADES_VERSION = 'grades'
+GRADES_TABLES = ('students', 'grades')
 
 @dataclass
 class Student:
@@ -43,30 +52,14 @@ class CourseValidator:
     
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self.valid_courses: Dict[str, Course] = {}
-        self._load_valid_courses()
-    
-    def _load_valid_courses(self) -> None:
-        """Load all valid courses from the database."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT course_code, course_title, credit_hours, prerequisite_course_code 
-                    FROM courses
-                """)
-                for row in cursor.fetchall():
-                    self.valid_courses[row[0]] = Course(
-                        code=row[0],
-                        title=row[1],
-                        credit_hours=row[2],
-                        prerequisite_code=row[3]
-                    )
-                logger.info(f"Loaded {len(self.valid_courses)} valid courses from database")
+            self.catalog = get_catalog(db_path)
         except sqlite3.Error as e:
             logger.error(f"Error loading courses from database: {e}")
             raise
-
+        self.valid_courses: Mapping[str, Course] = self.catalog.by_code
+        logger.info(f"Loaded {len(self.valid_courses)} valid courses from catalog")
+    
     def parse_course_info(self, course_column: str) -> Tuple[str, str]:
         """Parse course title and code from column header."""
         try:
@@ -82,27 +75,28 @@ class CourseValidator:
             logger.error(f"Error parsing course info from '{course_column}': {e}")
             raise
 
-    def validate_course(self, course_column: str) -> Tuple[bool, str, Dict]:
+    def validate_course(self, course_column: str, batch: Optional[str] = None) -> Tuple[bool, str, Dict]:
         """
-        Validate a course against the database.
+        Validate a course against the database, using the batch's catalog when it has one.
         Returns: (is_valid, course_code, validation_info)
         """
         try:
             course_title, course_code = self.parse_course_info(course_column)
+            valid_courses = self.catalog.for_batch(batch) if batch is not None else self.valid_courses
             
-            if course_code not in self.valid_courses:
+            if course_code not in valid_courses:
                 return False, course_code, {
                     "error": "Course not found in database",
                     "title": course_title,
                     "code": course_code
                 }
             
-            db_course = self.valid_courses[course_code]
-            if db_course.title != course_title:
+            db_course = valid_courses[course_code]
+            if db_course.course_title != course_title:
                 return False, course_code, {
                     "error": "Course title mismatch",
                     "csv_title": course_title,
-                    "db_title": db_course.title,
+                    "db_title": db_course.course_title,
                     "code": course_code
                 }
             
@@ -120,82 +114,83 @@ class CourseValidator:
 class GradeParser:
     """Handles parsing of grade CSV file and database operations."""
     
-    def __init__(self, db_path: str = DB_NAME):
-        """Initialize the parser with database path."""
+    def __init__(self, db_path: Optional[str] = DB_NAME,
+                 course_validator: Optional[CourseValidator] = None):
+        """
+        Initialize the parser with database path.
+
+        Args:
+            db_path: Database the grades are saved to, or None to only parse.
+            course_validator: Validates course columns; defaults to the catalog of db_path.
+        """
+        if db_path is None and course_validator is None:
+            raise ValueError("A parser without a database needs a course validator")
         self.db_path = db_path
-        self.course_validator = CourseValidator(db_path)
+        self.course_validator = course_validator or CourseValidator(db_path)
         self.validation_results: Dict[str, Dict] = {}  # course_column: validation_info
-        self._initialize_database()
+        self.source_name = "unknown"  # Recorded with every grade attempt saved
+        if db_path is not None:
+            self._initialize_database()
     
     def _initialize_database(self):
         """Sets up the database schema if it does not already exist."""
         with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Create tables using schema constants
-            cursor.execute(CREATE_TABLE_STUDENTS)
-            cursor.execute(CREATE_TABLE_GRADES)
-
+            initialize_student_schema(conn)
             logger.info("Database schema initialized.")
     
-    def parse_csv(self, file_path: str) -> List[Student]:
-        """Parse the CSV file and return a list of Student objects."""
+    def _validate_headers(self, headers: List[str], batch: Optional[str] = None) -> List[Optional[str]]:
+        """
+        Validate the course columns of the header row against the batch's catalog.
+        Returns the course code of every course column, or None for invalid ones.
+        """
+        course_columns = headers[10:]  # Columns after specialization
+        
+        # Validate all courses before processing
+        has_invalid_courses = False
+        course_codes = []
+        for course_column in course_columns:
+            is_valid, _, info = self.course_validator.validate_course(course_column, batch)
+            self.validation_results[course_column] = info
+            course_codes.append(info['code'] if is_valid else None)
+            if not is_valid:
+                has_invalid_courses = True
+                logger.warning(f"Invalid course: {info}")
+        
+        if has_invalid_courses:
+            logger.warning("\nFound invalid courses:")
+            for course, info in self.validation_results.items():
+                if "error" in info:
+                    logger.warning(f"  - {course}: {info['error']}")
+                    if "db_title" in info:
+                        logger.warning(f"    CSV title: {info['csv_title']}")
+                        logger.warning(f"    DB title: {info['db_title']}")
+        return course_codes
+    
+    def parse_csv(self, file_path: Source) -> List[Student]:
+        """
+        Parse the CSV file and return a list of Student objects.
+        Accepts a path, '-' for stdin or a binary stream, optionally gzip/zstd-compressed.
+        """
         try:
             students = []
-            with open(file_path, 'r', encoding='utf-8') as file:
+            self.source_name = _source_name(file_path)
+            with open_text(file_path, encoding='utf-8') as file:
                 csv_reader = csv.reader(file)
                 
                 # Skip the first row (BS(SE))
                 next(csv_reader)
                 
-                # Get headers and validate courses
+                # Get headers and validate courses against the sheet's batch,
+                # taken from the first student's roll number
                 headers = next(csv_reader)
-                course_columns = headers[10:]  # Columns after specialization
-                
-                # Validate all courses before processing
-                has_invalid_courses = False
-                for course_column in course_columns:
-                    is_valid, _, info = self.course_validator.validate_course(course_column)
-                    self.validation_results[course_column] = info
-                    if not is_valid:
-                        has_invalid_courses = True
-                        logger.warning(f"Invalid course: {info}")
-                
-                if has_invalid_courses:
-                    logger.warning("\nFound invalid courses:")
-                    for course, info in self.validation_results.items():
-                        if "error" in info:
-                            logger.warning(f"  - {course}: {info['error']}")
-                            if "db_title" in info:
-                                logger.warning(f"    CSV title: {info['csv_title']}")
-                                logger.warning(f"    DB title: {info['db_title']}")
+                first_row = next(csv_reader, None)
+                course_codes = self._validate_headers(headers, _sheet_batch(first_row))
                 
                 # Process each student row
-                for row in csv_reader:
-                    if not row or len(row) < 10:  # Skip empty rows
-                        continue
-                    
-                    # Create grades dictionary (only for valid courses)
-                    grades = {}
-                    for course_column, grade in zip(course_columns, row[10:]):
-                        if grade and grade != '-':
-                            info = self.validation_results[course_column]
-                            if "error" not in info:  # Only add grades for valid courses
-                                grades[info['code']] = grade
-                    
-                    student = Student(
-                        roll_no=row[1],
-                        name=row[2],
-                        section=row[3],
-                        credit_hours_attempted=int(row[4]) if row[4] else 0,
-                        credit_hours_earned=int(row[5]) if row[5] else 0,
-                        cgpa=float(row[6]) if row[6] else 0.0,
-                        warning_status=int(row[7]) if row[7] else 0,
-                        enrollment_status=row[8],
-                        specialization=row[9],
-                        grades=grades
-                    )
-                    students.append(student)
+                for row in itertools.chain([first_row] if first_row else [], csv_reader):
+                    record = _row_to_record(row, course_codes)
+                    if record is not None:
+                        students.append(_record_to_student(record))
             
             logger.info(f"Successfully parsed {len(students)} student records")
             return students
@@ -203,50 +198,268 @@ class GradeParser:
             logger.error(f"Error parsing CSV file: {e}")
             raise
     
-    def save_to_database(self, students: List[Student]) -> None:
-        """Save the parsed data to SQLite database."""
+    def parse_csv_parallel(self, file_path: Source, workers: Optional[int] = None) -> List[Student]:
+        """
+        Parse a large CSV file across several worker processes.
+
+        The file is memory-mapped and split into newline-aligned byte ranges
+        after the two header rows, never splitting inside a quoted field.
+        Each worker parses one range against the validated header and returns
+        compact record tuples, which are turned into students in file order.
+        Compressed files and streams fall back to parse_csv.
+        """
+        if not is_plain_file(file_path):
+            logger.info("Input is not a plain file, parsing serially")
+            return self.parse_csv(file_path)
+        
+        # Imported here to keep multiprocessing out of the import path
+        from concurrent.futures import ProcessPoolExecutor
+        
+        try:
+            self.source_name = _source_name(file_path)
+            with open(file_path, 'rb') as file, \
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Skip the first row (BS(SE)) and read the headers
+                header_start = _record_end(mm, 0)
+                data_start = _record_end(mm, header_start)
+                headers = next(csv.reader([mm[header_start:data_start].decode('utf-8')]))
+                first_row = next(csv.reader([mm[data_start:_record_end(mm, data_start)].decode('utf-8')]), None)
+                course_codes = self._validate_headers(headers, _sheet_batch(first_row))
+                ranges = _split_ranges(mm, data_start, (workers or os.cpu_count() or 1) * 4)
+            
+            students = []
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                batches = executor.map(
+                    _parse_range,
+                    [str(file_path)] * len(ranges),
+                    [start for start, _ in ranges],
+                    [end for _, end in ranges],
+                    [course_codes] * len(ranges),
+                )
+                for batch in batches:
+                    students.extend(_record_to_student(record) for record in batch)
+            
+            logger.info(f"Successfully parsed {len(students)} student records from {len(ranges)} ranges")
+            return students
+        except Exception as e:
+            logger.error(f"Error parsing CSV file: {e}")
+            raise
+    
+    def save_to_database(self, students: List[Student], term: str = '',
+                         source_name: Optional[str] = None) -> None:
+        """
+        Save the parsed data to SQLite database.
+        Grades are appended to the attempt history; `grades` keeps the latest attempt.
+
+        Args:
+            students: Parsed student records.
+            term: Term the grades belong to, sortable as text (e.g. '2024-2').
+            source_name: Identifies the imported file; defaults to the last parsed source.
+        """
+        if self.db_path is None:
+            raise ValueError("This parser has no database to save to")
         try:
             with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                for student in students:
-                    # Insert student record using your existing schema
-                    cursor.execute(INSERT_STUDENT, (
-                        student.roll_no,
-                        student.name,
-                        student.section,
-                        student.credit_hours_attempted,
-                        student.credit_hours_earned,
-                        student.cgpa,
-                        student.warning_status,
-                        student.enrollment_status,
-                        student.specialization
-                    ))
-                    
-                    # Insert grade records
-                    grade_records = [
-                        (student.roll_no, course_code, grade)
-                        for course_code, grade in student.grades.items()
-                    ]
-                    
-                    if grade_records:
-                        cursor.executemany(INSERT_GRADE, grade_records)
-                
+                write_students(conn.cursor(), students, term, source_name or self.source_name)
                 conn.commit()
                 logger.info("Successfully saved all records to database")
+            refresh_student_index(self.db_path)
         except sqlite3.Error as e:
             logger.error(f"Error saving to database: {e}")
             raise
+    
+    def grade_history(self, roll_no: str) -> List[Tuple[str, str, str, str, str]]:
+        """Return every grade attempt of a student as (course_code, grade, term, source, imported_at)."""
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute(fetch_grade_history, (roll_no,)).fetchall()
+
+def _sheet_batch(row: Optional[List[str]]) -> Optional[str]:
+    """Returns the batch of a grade sheet from a student row; sheets hold one batch."""
+    return roll_no_batch(row[1]) if row and len(row) > 1 else None
+
+def _source_name(file_path: Source) -> str:
+    if not isinstance(file_path, (str, os.PathLike)):
+        return "<stream>"
+    return "<stdin>" if os.fspath(file_path) == "-" else os.fspath(file_path)
+
+def initialize_student_schema(conn: sqlite3.Connection) -> None:
+    """Create the student and grade tables if they do not already exist."""
+    cursor = conn.cursor()
+    
+    has_attempts = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'grade_attempts'"
+    ).fetchone()
+    
+    # Create tables using schema constants
+    cursor.execute(CREATE_TABLE_STUDENTS)
+    cursor.execute(CREATE_TABLE_GRADES)
+    cursor.execute(CREATE_INDEX_STUDENTS_NAME)
+    cursor.execute(CREATE_INDEX_STUDENTS_SECTION)
+    cursor.execute(CREATE_TABLE_GRADE_SOURCES)
+    source_table = cursor.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'grade_sources'"
+    ).fetchone()[0]
+    if 'UNIQUE' in source_table:
+        for statement in MIGRATE_GRADE_SOURCES:
+            cursor.execute(statement)
+    cursor.execute(CREATE_TABLE_GRADE_ATTEMPTS)
+    cursor.execute(CREATE_TRIGGER_GRADE_ATTEMPTS_CURRENT)
+    
+    # Grade statistics are maintained by triggers on every save
+    initialize_grade_statistics(conn)
+    initialize_data_versions(conn, GRADES_VERSION, GRADES_TABLES)
+    
+    # Grades saved before attempts were tracked become their first attempt
+    if not has_attempts:
+        cursor.execute(BACKFILL_GRADE_ATTEMPTS, (_source_id(cursor, "legacy"),))
+
+def _source_id(cursor: sqlite3.Cursor, source_name: str) -> int:
+    cursor.execute(INSERT_GRADE_SOURCE, (source_name,))
+    return cursor.lastrowid
+
+def write_students(cursor: sqlite3.Cursor, students: List[Student],
+                   term: str = '', source_name: str = "unknown") -> None:
+    """
+    Insert student records and append their new grade attempts. The caller commits.
+
+    Only grades a student has not received before for a course, or that differ
+    from their latest grade in it, are appended.
+    """
+    # Insert student records using your existing schema
+    cursor.executemany(INSERT_STUDENT, [
+        (
+            student.roll_no,
+            student.name,
+            student.section,
+            student.credit_hours_attempted,
+            student.credit_hours_earned,
+            student.cgpa,
+            student.warning_status,
+            student.enrollment_status,
+            student.specialization
+        )
+        for student in students
+    ])
+    
+    # Append grade attempts in one batch; triggers update `grades` and the statistics
+    source_id = _source_id(cursor, source_name)
+    cursor.executemany(INSERT_GRADE_ATTEMPT, [
+        (student.roll_no, course_code, grade, term, source_id)
+        for student in students
+        for course_code, grade in student.grades.items()
+    ])
+    if cursor.rowcount <= 0:
+        cursor.execute(DELETE_GRADE_SOURCE, (source_id,))
+        logger.info(f"Grades from '{source_name}' add no new attempts")
+    else:
+        logger.info(f"Appended {cursor.rowcount} grade attempts from '{source_name}'")
+
+# Compact, picklable form of a student row:
+# (roll_no, name, section, credit_hours_attempted, credit_hours_earned,
+#  cgpa, warning_status, enrollment_status, specialization, grades)
+StudentRecord = Tuple[str, str, str, int, int, float, int, str, str, Tuple[Tuple[str, str], ...]]
+
+def _row_to_record(row: List[str], course_codes: List[Optional[str]]) -> Optional[StudentRecord]:
+    """Convert a CSV row into a student record, or None for empty rows."""
+    if not row or len(row) < 10:  # Skip empty rows
+        return None
+    
+    # Collect grades (only for valid courses)
+    grades = tuple(
+        (course_code, grade)
+        for course_code, grade in zip(course_codes, row[10:])
+        if course_code is not None and grade and grade != '-'
+    )
+    return (
+        row[1],
+        row[2],
+        row[3],
+        int(row[4]) if row[4] else 0,
+        int(row[5]) if row[5] else 0,
+        float(row[6]) if row[6] else 0.0,
+        int(row[7]) if row[7] else 0,
+        row[8],
+        row[9],
+        grades,
+    )
+
+def _record_to_student(record: StudentRecord) -> Student:
+    return Student(*record[:9], grades=dict(record[9]))
+
+def _record_end(mm: mmap.mmap, start: int) -> int:
+    """Return the offset just past the CSV record starting at ``start``."""
+    pos, quotes = start, 0
+    while True:
+        newline = mm.find(b'\n', pos)
+        if newline == -1:
+            return len(mm)
+        quotes += _count_quotes(mm, pos, newline)
+        pos = newline + 1
+        # An odd number of quotes means the newline is inside a quoted field
+        if quotes % 2 == 0:
+            return pos
+
+def _count_quotes(mm: mmap.mmap, start: int, end: int, chunk_size: int = 1 << 24) -> int:
+    """Count double quotes in a byte range without copying it all at once."""
+    count = 0
+    for offset in range(start, end, chunk_size):
+        count += mm[offset:min(offset + chunk_size, end)].count(b'"')
+    return count
+
+def _split_ranges(mm: mmap.mmap, start: int, parts: int) -> List[Tuple[int, int]]:
+    """Split ``mm[start:]`` into roughly equal ranges that begin at record boundaries."""
+    size = len(mm)
+    step = max((size - start) // parts, 1)
+    has_quotes = mm.find(b'"', start) != -1
+    
+    ranges = []
+    range_start = scanned = start
+    quotes = 0  # quotes seen between range_start and scanned
+    while range_start < size:
+        target = max(range_start + step, scanned)
+        if target >= size:
+            ranges.append((range_start, size))
+            break
+        newline = mm.find(b'\n', target)
+        if newline == -1:
+            ranges.append((range_start, size))
+            break
+        if has_quotes:
+            quotes += _count_quotes(mm, scanned, newline)
+        scanned = newline + 1
+        if quotes % 2 == 0:
+            ranges.append((range_start, scanned))
+            range_start, quotes = scanned, 0
+    return ranges
+
+def _parse_range(file_path: str, start: int, end: int,
+                 course_codes: List[Optional[str]]) -> List[StudentRecord]:
+    """Worker: parse the student rows in one byte range of the file."""
+    with open(file_path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode('utf-8')
+    records = []
+    for row in csv.reader(io.StringIO(text, newline='')):
+        record = _row_to_record(row, course_codes)
+        if record is not None:
+            records.append(record)
+    return records
 
 if __name__ == "__main__":
     """Main function to run the grade parser."""
+    # Set up logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    
     try:
         # Initialize parser
         parser = GradeParser()
         
-        # Parse CSV file
-        csv_path = Path("grade.csv")
-        if not csv_path.exists():
+        # Parse CSV file ('-' reads from stdin)
+        csv_path = Path(sys.argv[1] if len(sys.argv) > 1 else "grade.csv")
+        if str(csv_path) != "-" and not csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
         
         students = parser.parse_csv(str(csv_path))
@@ -264,8 +477,8 @@ if __name__ == "__main__":
                 logger.info("Operation cancelled by user")
                 exit(0)
 
-        # Save to database
-        parser.save_to_database(students)
+        # Save to database, optionally tagged with the term, e.g. 2024-2
+        parser.save_to_database(students, term=sys.argv[2] if len(sys.argv) > 2 else '')
         
         logger.info("Grade parsing and database creation completed successfully")
     
@@ -0,0 +1,165 @@
+import sqlite3
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from constants import grading
+from constants.database import queries
+from constants.database import schema
+from constants.database import insertions
+from constants.database.config import DB_NAME
+
+logger = logging.getLogger(__name__)
+
+# Stats table and grouping columns for each reporting scope
+SCOPES = {
+    'course': ('course_grade_stats', ('course_code',)),
+    'section': ('section_grade_stats', ('section', 'course_code')),
+    'program': ('program_grade_stats', ('program_name', 'course_code')),
+}
+
+STATS_TRIGGERS = (
+    ('grades_insert_stats', schema.CREATE_TRIGGER_GRADES_INSERT_STATS),
+    ('grades_delete_stats', schema.CREATE_TRIGGER_GRADES_DELETE_STATS),
+    ('grades_update_stats', schema.CREATE_TRIGGER_GRADES_UPDATE_STATS),
+    ('students_section_stats', schema.CREATE_TRIGGER_STUDENTS_SECTION_STATS),
+)
+
+@dataclass
+class GradeSummary:
+    """Aggregated grade outcomes for a course within a scope."""
+    scope_key: Optional[str]  # section or program name, None for course scope
+    course_code: str
+    students: int
+    passed: int
+    failed: int
+    withdrawn: int
+    incomplete: int
+    average_grade_points: Optional[float]
+
+def initialize_grade_statistics(conn: sqlite3.Connection) -> None:
+    """
+    Creates the materialized statistics tables and the triggers maintaining them.
+    Expects the students and grades tables to exist. Statistics are rebuilt once
+    when the triggers are first installed on a database that already has grades.
+    """
+    cursor = conn.cursor()
+    cursor.execute(schema.CREATE_TABLE_GRADE_POINTS)
+    cursor.execute(schema.CREATE_TABLE_SECTION_PROGRAMS)
+    cursor.execute(schema.CREATE_TABLE_COURSE_GRADE_STATS)
+    cursor.execute(schema.CREATE_TABLE_SECTION_GRADE_STATS)
+    cursor.execute(schema.CREATE_TABLE_PROGRAM_GRADE_STATS)
+
+    cursor.executemany(insertions.INSERT_GRADE_POINTS, [
+        (grade, grading.GRADE_POINTS.get(grade), outcome)
+        for grade, outcome in grading.GRADE_OUTCOMES.items()
+    ])
+    if cursor.execute("SELECT 1 FROM section_programs LIMIT 1").fetchone() is None:
+        cursor.executemany(insertions.INSERT_SECTION_PROGRAM, grading.SECTION_PROGRAMS.items())
+
+    existing = {
+        row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    }
+    for name, statement in STATS_TRIGGERS:
+        cursor.execute(statement)
+
+    if any(name not in existing for name, _ in STATS_TRIGGERS):
+        _rebuild(cursor)
+
+def _rebuild(cursor: sqlite3.Cursor) -> None:
+    for table, _ in SCOPES.values():
+        cursor.execute(f"DELETE FROM {table}")
+    cursor.execute(insertions.REBUILD_COURSE_GRADE_STATS)
+    cursor.execute(insertions.REBUILD_SECTION_GRADE_STATS)
+    cursor.execute(insertions.REBUILD_PROGRAM_GRADE_STATS)
+
+class GradeStatistics:
+    """Query API over the materialized per-course, per-section and per-program grade statistics."""
+
+    def __init__(self, db_path: str = DB_NAME):
+        self.db_path = db_path
+        with sqlite3.connect(self.db_path) as conn:
+            initialize_grade_statistics(conn)
+
+    def rebuild(self) -> None:
+        """Recomputes all statistics from the grades table."""
+        with sqlite3.connect(self.db_path) as conn:
+            _rebuild(conn.cursor())
+            conn.commit()
+        logger.info("Grade statistics rebuilt.")
+
+    def _filters(self, scope: str, scope_key: Optional[str], course_code: Optional[str]):
+        if scope not in SCOPES:
+            raise ValueError(f"Unknown scope '{scope}', expected one of {list(SCOPES)}")
+        table, key_columns = SCOPES[scope]
+        filters, params = [], []
+        if scope_key is not None and len(key_columns) > 1:
+            filters.append(f"AND st.{key_columns[0]} = ?")
+            params.append(scope_key)
+        if course_code is not None:
+            filters.append("AND st.course_code = ?")
+            params.append(course_code)
+        return table, key_columns, "\n        ".join(filters), params
+
+    def summary(self, scope: str = 'course', scope_key: Optional[str] = None,
+                course_code: Optional[str] = None) -> List[GradeSummary]:
+        """
+        Returns pass/fail/withdraw counts and average grade points.
+
+        Args:
+            scope: 'course', 'section' or 'program'.
+            scope_key: Restricts section or program scope to one section or program.
+            course_code: Restricts the summary to one course.
+        """
+        table, key_columns, filters, params = self._filters(scope, scope_key, course_code)
+        query = queries.grade_summary_template.format(
+            table=table,
+            key_columns=", ".join(f"st.{column}" for column in key_columns),
+            filters=filters,
+        )
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        summaries = []
+        for row in rows:
+            if len(key_columns) == 1:
+                row = (None,) + tuple(row)
+            summaries.append(GradeSummary(*row))
+        return summaries
+
+    def distribution(self, course_code: str, scope: str = 'course',
+                     scope_key: Optional[str] = None) -> Dict[str, int]:
+        """Returns the number of students holding each grade in a course."""
+        table, _, filters, params = self._filters(scope, scope_key, course_code)
+        query = queries.grade_distribution_template.format(table=table, filters=filters)
+        with sqlite3.connect(self.db_path) as conn:
+            return dict(conn.execute(query, params).fetchall())
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description="Report materialized grade statistics.")
+    parser.add_argument("scope", nargs="?", default="course", choices=list(SCOPES))
+    parser.add_argument("--key", help="Section or program name")
+    parser.add_argument("--course", help="Course code")
+    parser.add_argument("--rebuild", action="store_true", help="Recompute all statistics from grades")
+    args = parser.parse_args()
+
+    statistics = GradeStatistics()
+    if args.rebuild:
+        statistics.rebuild()
+
+    for summary in statistics.summary(args.scope, args.key, args.course):
+        average = f"{summary.average_grade_points:.2f}" if summary.average_grade_points is not None else "-"
+        prefix = f"{summary.scope_key} " if summary.scope_key else ""
+        print(
+            f"{prefix}{summary.course_code}: {summary.students} students, "
+            f"{summary.passed} passed, {summary.failed} failed, "
+            f"{summary.withdrawn} withdrawn, {summary.incomplete} incomplete, "
+            f"average {average}"
+        )
@@ -0,0 +1,86 @@
+import io
+import os
+import sys
+import gzip
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, TextIO, Union
+
+# A local path ('-' for stdin) or an already opened binary stream
+Source = Union[str, os.PathLike, BinaryIO]
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _is_path(source: Source) -> bool:
+    return isinstance(source, (str, os.PathLike))
+
+
+def _decompress(stream: BinaryIO) -> BinaryIO:
+    """Wraps a peekable stream in a decompressor if it starts with a known magic number."""
+    magic = stream.peek(4)[:4]
+    if magic.startswith(GZIP_MAGIC):
+        return gzip.GzipFile(fileobj=stream, mode="rb")
+    if magic.startswith(ZSTD_MAGIC):
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("Reading zstd-compressed input requires the 'zstandard' package") from e
+        return zstandard.ZstdDecompressor().stream_reader(stream, closefd=False)
+    return stream
+
+
+@contextmanager
+def open_binary(source: Source) -> Iterator[BinaryIO]:
+    """
+    Opens a path or binary stream for reading, transparently decompressing
+    gzip and zstd input. Streams passed in by the caller are left open.
+    """
+    if _is_path(source):
+        if os.fspath(source) == "-":
+            raw, owned = sys.stdin.buffer, False
+        else:
+            raw, owned = open(source, "rb"), True
+    else:
+        raw, owned = source, False
+
+    # Buffer unpeekable streams (e.g. BytesIO) so the magic number can be
+    # inspected without consuming it
+    buffered = None
+    stream = raw
+    if not hasattr(raw, "peek"):
+        buffered = stream = io.BufferedReader(raw)
+
+    try:
+        yield _decompress(stream)
+    finally:
+        if buffered is not None:
+            buffered.detach()
+        if owned:
+            raw.close()
+
+
+@contextmanager
+def open_text(source: Source, encoding: str = "utf-8") -> Iterator[TextIO]:
+    """Opens a source as text, decoding incrementally as it is read."""
+    with open_binary(source) as stream:
+        text = io.TextIOWrapper(stream, encoding=encoding, newline="")
+        try:
+            yield text
+        finally:
+            text.detach()
+
+
+def read_bytes(source: Source) -> bytes:
+    """Reads and decompresses an entire source into memory."""
+    with open_binary(source) as stream:
+        return stream.read()
+
+
+def is_plain_file(source: Source) -> bool:
+    """Returns True if the source is an uncompressed file on disk."""
+    if not _is_path(source) or os.fspath(source) == "-":
+        return False
+    with open(source, "rb") as file:
+        magic = file.read(4)
+    return not (magic.startswith(GZIP_MAGIC) or magic.startswith(ZSTD_MAGIC))
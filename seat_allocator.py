@@ -0,0 +1,231 @@
+import csv
+import heapq
+import sqlite3
+import logging
+import argparse
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from constants.database import queries
+from constants.database.config import DB_NAME, SECTION_CAPACITY
+
+logger = logging.getLogger(__name__)
+
+# Smaller ranks are admitted first: higher CGPA, lower warning status, more
+# credit hours earned (closer to graduation), then roll number
+Rank = Tuple[float, int, int, str]
+
+@dataclass
+class CourseAllocation:
+    """Seats and waitlist of a capacity-limited course."""
+    course_code: str
+    seats: int
+    eligible: int
+    sections: List[List[str]] = field(default_factory=list)  # roll numbers in merit order
+    waitlist: List[str] = field(default_factory=list)
+
+    @property
+    def admitted(self) -> List[str]:
+        return [roll_no for section in self.sections for roll_no in section]
+
+class _Candidate:
+    """Heap entry ordered so that the weakest shortlisted candidate sits at the root."""
+    __slots__ = ("rank",)
+
+    def __init__(self, rank: Rank):
+        self.rank = rank
+
+    def __lt__(self, other: "_Candidate") -> bool:
+        return self.rank > other.rank
+
+def rank(roll_no: str, cgpa: float, warning_status: int, credit_hours_earned: int) -> Rank:
+    """Returns the admission rank of a student; lower ranks get seats first."""
+    return (-cgpa, warning_status, -credit_hours_earned, roll_no)
+
+class SeatAllocator:
+    """
+    Allocates a fixed number of seats per course by merit.
+
+    Eligible students are streamed from the database once and each course
+    keeps only its best ``seats + waitlist_size`` candidates in a bounded
+    heap, so a course with n eligible students costs O(n log k) instead of
+    sorting all n. Courses are then filled scarcest first; a student is not
+    seated twice in the same timetable slot or above ``max_courses``, and
+    the seat passes to the next shortlisted student.
+    """
+
+    def __init__(self, db_path: str = DB_NAME, section_capacity: int = SECTION_CAPACITY,
+                 waitlist_size: int = SECTION_CAPACITY):
+        self.db_path = db_path
+        self.section_capacity = section_capacity
+        self.waitlist_size = waitlist_size
+
+    def shortlist(self, depths: Dict[str, int]) -> Tuple[Dict[str, List[Rank]], Dict[str, int]]:
+        """
+        Streams eligible students and keeps the best candidates of each course.
+
+        Args:
+            depths: Number of candidates to keep per course code.
+
+        Returns:
+            The shortlisted ranks of each course, best first, and the number of
+            eligible students per course.
+        """
+        heaps: Dict[str, List[_Candidate]] = {code: [] for code in depths}
+        eligible = dict.fromkeys(depths, 0)
+        with sqlite3.connect(self.db_path) as conn:
+            for course_code, roll_no, cgpa, warning_status, earned in conn.execute(
+                    queries.get_eligible_candidates):
+                heap = heaps.get(course_code)
+                if heap is None:
+                    continue
+                eligible[course_code] += 1
+                candidate = _Candidate(rank(roll_no, cgpa, warning_status, earned))
+                if len(heap) < depths[course_code]:
+                    heapq.heappush(heap, candidate)
+                elif candidate.rank < heap[0].rank:
+                    heapq.heapreplace(heap, candidate)
+
+        shortlists = {
+            code: sorted(candidate.rank for candidate in heap) for code, heap in heaps.items()
+        }
+        return shortlists, eligible
+
+    def allocate(self, course_codes: Iterable[str], sections: Optional[Dict[str, int]] = None,
+                 default_sections: int = 1, course_slots: Optional[Dict[str, int]] = None,
+                 max_courses: Optional[int] = None) -> Dict[str, CourseAllocation]:
+        """
+        Allocates seats and waitlists for a set of courses in one run.
+
+        Args:
+            course_codes: Courses to allocate.
+            sections: Number of sections of each course; others get ``default_sections``.
+            default_sections: Sections of courses not listed in ``sections``.
+            course_slots: Timetable slot of each course. A student holds at most
+                one seat per slot.
+            max_courses: Maximum seats per student, if limited.
+        """
+        course_codes = list(dict.fromkeys(course_codes))
+        sections = sections or {}
+        course_slots = course_slots or {}
+        seats = {
+            code: sections.get(code, default_sections) * self.section_capacity for code in course_codes
+        }
+        depths = {code: seats[code] + self.waitlist_size for code in course_codes}
+        shortlists, eligible = self.shortlist(depths)
+
+        # Scarcest seats first, so conflicts are settled in favour of the
+        # course a student would find hardest to get into again
+        order = sorted(course_codes, key=lambda code: (-eligible[code] / max(seats[code], 1), code))
+
+        held_slots: Dict[str, Set[int]] = {}
+        held_courses: Dict[str, int] = {}
+        allocations = {}
+        for course_code in order:
+            slot = course_slots.get(course_code)
+            while True:
+                admitted, waitlist = [], []
+                for candidate_rank in shortlists[course_code]:
+                    roll_no = candidate_rank[-1]
+                    if slot is not None and slot in held_slots.get(roll_no, ()):
+                        continue
+                    if max_courses is not None and held_courses.get(roll_no, 0) >= max_courses:
+                        continue
+                    if len(admitted) < seats[course_code]:
+                        admitted.append(roll_no)
+                    elif len(waitlist) < self.waitlist_size:
+                        waitlist.append(roll_no)
+                    else:
+                        break
+
+                # Conflicts used up the shortlist; widen it for this course only
+                short = len(admitted) + len(waitlist) < seats[course_code] + self.waitlist_size
+                if not short or len(shortlists[course_code]) >= eligible[course_code]:
+                    break
+                depths[course_code] *= 2
+                widened, _ = self.shortlist({course_code: depths[course_code]})
+                shortlists[course_code] = widened[course_code]
+
+            for roll_no in admitted:
+                held_courses[roll_no] = held_courses.get(roll_no, 0) + 1
+                if slot is not None:
+                    held_slots.setdefault(roll_no, set()).add(slot)
+
+            allocations[course_code] = CourseAllocation(
+                course_code=course_code,
+                seats=seats[course_code],
+                eligible=eligible[course_code],
+                sections=[
+                    admitted[start:start + self.section_capacity]
+                    for start in range(0, len(admitted), self.section_capacity)
+                ],
+                waitlist=waitlist,
+            )
+
+        logger.info(
+            f"Allocated {sum(len(a.admitted) for a in allocations.values())} seats "
+            f"across {len(allocations)} courses."
+        )
+        return {code: allocations[code] for code in course_codes}
+
+    def allocate_semester(self, program_name: str, semester: int,
+                          sections: Optional[Dict[str, int]] = None, default_sections: int = 1,
+                          slots: Optional[int] = None,
+                          max_courses: Optional[int] = None) -> Dict[str, CourseAllocation]:
+        """
+        Allocates every course offered to a program in a semester.
+
+        When ``slots`` is given, courses are placed in that many timetable slots
+        by TimetableScheduler and each course is held to the slot of its first
+        section, so a student is never seated in two courses meeting together.
+        """
+        from timetable_scheduler import TimetableScheduler
+
+        scheduler = TimetableScheduler(self.db_path, self.section_capacity)
+        offerings = scheduler.fetch_offerings(program_name, semester)
+        course_slots = None
+        if slots is not None:
+            course_slots = {}
+            for assignment in scheduler.assign_slots(offerings, slots):
+                course_slots.setdefault(assignment.course_code, assignment.slot)
+        return self.allocate(offerings, sections, default_sections, course_slots, max_courses)
+
+def export_allocations_to_csv(allocations: Dict[str, CourseAllocation], path: str) -> None:
+    """Writes one row per seat or waitlist position."""
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["Course Code", "Section", "Position", "Roll No"])
+        for allocation in allocations.values():
+            for section, roll_numbers in enumerate(allocation.sections, start=1):
+                for position, roll_no in enumerate(roll_numbers, start=1):
+                    writer.writerow([allocation.course_code, section, position, roll_no])
+            for position, roll_no in enumerate(allocation.waitlist, start=1):
+                writer.writerow([allocation.course_code, "Waitlist", position, roll_no])
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+    )
+
+    parser = argparse.ArgumentParser(description="Allocate course seats by merit for a semester.")
+    parser.add_argument("program", help="Program name, e.g. 'Software Engineering'")
+    parser.add_argument("semester", type=int)
+    parser.add_argument("--sections", type=int, default=1, help="Sections offered per course")
+    parser.add_argument("--slots", type=int, default=None, help="Timetable slots; prevents clashing seats")
+    parser.add_argument("--max-courses", type=int, default=None, help="Maximum seats per student")
+    parser.add_argument("--csv", help="Export allocations and waitlists to this file")
+    args = parser.parse_args()
+
+    allocator = SeatAllocator()
+    allocations = allocator.allocate_semester(
+        args.program, args.semester, default_sections=args.sections,
+        slots=args.slots, max_courses=args.max_courses,
+    )
+    for allocation in allocations.values():
+        print(
+            f"{allocation.course_code}: {len(allocation.admitted)}/{allocation.seats} seats, "
+            f"{allocation.eligible} eligible, {len(allocation.waitlist)} waitlisted"
+        )
+    if args.csv:
+        export_allocations_to_csv(allocations, args.csv)
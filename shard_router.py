@@ -0,0 +1,134 @@
+import re
+import sys
+import sqlite3
+import logging
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from constants.database import queries
+from constants.database.config import SHARD_DIR, CATALOG_DB_NAME
+from grade_processor import (
+    CourseValidator, GradeParser, Student, initialize_student_schema, write_students
+)
+
+logger = logging.getLogger(__name__)
+
+# Roll numbers look like 22P-3000: intake year, campus letter, serial
+ROLL_NO_PATTERN = re.compile(r'^(\d+)([A-Z]+)-')
+
+def shard_key(roll_no: str, by: str = 'batch') -> str:
+    """
+    Returns the shard a roll number belongs to.
+
+    Args:
+        roll_no: The student's roll number.
+        by: 'batch' to shard by intake and campus (22P), 'campus' by campus only (P).
+    """
+    match = ROLL_NO_PATTERN.match(roll_no)
+    if not match:
+        raise ValueError(f"Cannot derive a shard from roll number '{roll_no}'")
+    if by == 'batch':
+        return match.group(1) + match.group(2)
+    if by == 'campus':
+        return match.group(2)
+    raise ValueError(f"Unknown sharding scheme '{by}'")
+
+class ShardRouter:
+    """
+    Routes students and grades to one database file per batch or campus.
+
+    Courses and programs live in a shared catalog database, which is attached
+    to each shard as ``catalog`` for cross-shard queries. Writes to different
+    shards hold different locks, so batches can be ingested concurrently.
+    """
+
+    def __init__(self, base_dir: str = SHARD_DIR, by: str = 'batch'):
+        self.base_dir = Path(base_dir)
+        self.by = by
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.catalog_path = self.base_dir / CATALOG_DB_NAME
+
+    def shard_path(self, key: str) -> Path:
+        return self.base_dir / f"{key}.sqlite3"
+
+    def shard_paths(self) -> List[Path]:
+        """Returns the existing shard files."""
+        return sorted(
+            path for path in self.base_dir.glob("*.sqlite3")
+            if path.name != CATALOG_DB_NAME
+        )
+
+    def route(self, students: List[Student]) -> Dict[str, List[Student]]:
+        """Groups students by their shard."""
+        shards: Dict[str, List[Student]] = {}
+        for student in students:
+            shards.setdefault(shard_key(student.roll_no, self.by), []).append(student)
+        return shards
+
+    def _write_shard(self, key: str, students: List[Student], term: str, source_name: str) -> int:
+        with sqlite3.connect(self.shard_path(key)) as conn:
+            initialize_student_schema(conn)
+            write_students(conn.cursor(), students, term, source_name)
+            conn.commit()
+        logger.info(f"Saved {len(students)} students to shard {key}")
+        return len(students)
+
+    def save_students(self, students: List[Student], term: str = '', source_name: str = "unknown",
+                      workers: Optional[int] = None) -> None:
+        """Writes students to their shards, one writer per shard in parallel."""
+        shards = self.route(students)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(
+                lambda key: self._write_shard(key, shards[key], term, source_name), shards
+            ))
+
+    def _query_shard(self, path: Path, query: str, params: Tuple) -> List[Tuple]:
+        with sqlite3.connect(f"file:{path}?mode=ro", uri=True) as conn:
+            conn.execute("ATTACH DATABASE ? AS catalog", (f"file:{self.catalog_path}?mode=ro",))
+            return conn.execute(query, params).fetchall()
+
+    def query(self, query: str, params: Tuple = (), workers: Optional[int] = None) -> List[Tuple]:
+        """Runs a query on every shard in parallel and concatenates the results."""
+        paths = self.shard_paths()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(lambda path: self._query_shard(path, query, params), paths)
+            return [row for rows in results for row in rows]
+
+    def get_prerequisite(self, course_name: str) -> Optional[str]:
+        # Read-only like _query_shard, so federated reads never write to the shared catalog
+        with sqlite3.connect(f"file:{self.catalog_path}?mode=ro", uri=True) as conn:
+            row = conn.execute(queries.get_prerequisite_query, (course_name,)).fetchone()
+        return row[0] if row else None
+
+    def get_eligible_students(self, course_name: str) -> List[Tuple[str, str]]:
+        """Returns (roll_no, name) of students eligible for a course across all shards."""
+        prerequisite_course_code = self.get_prerequisite(course_name)
+        if not prerequisite_course_code:
+            return []
+        return self.query(queries.shard_eligible_students, (course_name, prerequisite_course_code))
+
+    def course_enrollment(self, program_name: str, semester: int) -> List[Tuple[str, str, int]]:
+        """Returns (code, title, students with a grade) for a program's semester across all shards."""
+        totals: Dict[Tuple[str, str], int] = {}
+        for course_code, course_title, students in self.query(
+                queries.shard_course_enrollment, (program_name, semester)):
+            totals[(course_code, course_title)] = totals.get((course_code, course_title), 0) + students
+        return [
+            (course_code, course_title, students)
+            for (course_code, course_title), students in sorted(totals.items(), key=lambda item: item[0][1])
+        ]
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    # Grades are validated against the shared catalog, then routed to shards;
+    # the parser writes nothing itself. Load the catalog first, e.g.
+    # CSVProcessor(csv_path, "shards/catalog.sqlite3").
+    router = ShardRouter()
+    parser = GradeParser(None, CourseValidator(str(router.catalog_path)))
+    students = parser.parse_csv(sys.argv[1] if len(sys.argv) > 1 else "grade.csv")
+    router.save_students(students, source_name=parser.source_name)
@@ -4,6 +4,10 @@ from tkinter import messagebox, ttk
 from PIL import Image, ImageTk
 import csv
 
+from constants.database.config import SECTION_CAPACITY
+from course_catalog import get_catalog
+from student_search import get_student_index, fetch_transcript
+
 # Function to get courses based on program and semester
 def fetch_courses_by_program_and_semester(program, semester, cursor):
     query = '''
@@ -17,24 +21,15 @@ def fetch_courses_by_program_and_semester(program, semester, cursor):
     return [course[0] for course in courses]
 
 # Function to get prerequisite course code for a given course name
-def get_prerequisite(course_name, cursor):
-    query = '''
-    SELECT prerequisite_course_code
-    FROM courses
-    WHERE course_title = ?;
-    '''
-    cursor.execute(query, (course_name,))
-    result = cursor.fetchone()
-    if result:
-        return result[0]
-    return None
+def get_prerequisite(course_name, db_path):
+    return get_catalog(db_path).prerequisite(course_name)
 
 # Function to get eligible students for the given course name
 def get_eligible_students(db_path, course_name):
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
-    prerequisite_course_code = get_prerequisite(course_name, cursor)
+    prerequisite_course_code = get_prerequisite(course_name, db_path)
     
     if prerequisite_course_code:
         query = '''
@@ -84,7 +79,7 @@ def show_eligible_students(course_name_entry, result_label):
     else:
         result_text = f"Eligible Students Count: {count}\n\n" + "\n".join(eligible_students)
         
-        sections = (count // 50) + (1 if count % 50 > 0 else 0)
+        sections = (count // SECTION_CAPACITY) + (1 if count % SECTION_CAPACITY > 0 else 0)
         result_text += f"\n\nTotal Sections: {sections}"
 
         result_label.config(text=result_text)
@@ -135,6 +130,33 @@ def export_courses_to_csv(courses):
     else:
         messagebox.showinfo("No Data", "No courses to export.")
 
+# Function to list students matching the search box as the user types
+def search_students(search_entry, results_listbox):
+    results_listbox.delete(0, tk.END)
+    for roll_no, name, section in get_student_index('project.sqlite3').search(search_entry.get()):
+        results_listbox.insert(tk.END, f"{roll_no}  {name}  ({section})")
+
+# Function to show the transcript of the selected student
+def show_transcript(results_listbox, transcript_label):
+    selection = results_listbox.curselection()
+    if not selection:
+        return
+    roll_no = results_listbox.get(selection[0]).split()[0]
+
+    transcript = fetch_transcript(roll_no, 'project.sqlite3')
+    if not transcript:
+        transcript_label.config(text=f"No grades found for {roll_no}.")
+        return
+
+    lines = [f"Transcript of {roll_no}"]
+    current_semester = object()
+    for semester, course_code, course_title, credit_hours, grade in transcript:
+        if semester != current_semester:
+            current_semester = semester
+            lines.append(f"\nSemester {semester}" if semester is not None else "\nOutside Study Plan")
+        lines.append(f"{course_code}  {course_title or ''}  {credit_hours or '-'} Cr.  {grade}")
+    transcript_label.config(text="\n".join(lines))
+
 # Create the main window
 root = tk.Tk()
 root.title("Fast Batch Advisor Automation")
@@ -169,6 +191,9 @@ show_courses_button.grid(row=0, column=0, padx=10, pady=10)
 show_eligible_button = tk.Button(button_frame, text="Show Eligible Students", command=lambda: notebook.select(eligible_page), font=("Arial", 14), width=20, bg="#FF9800", fg="white")
 show_eligible_button.grid(row=1, column=0, padx=10, pady=10)
 
+show_transcript_button = tk.Button(button_frame, text="Student Transcript", command=lambda: notebook.select(transcript_page), font=("Arial", 14), width=20, bg="#2196F3", fg="white")
+show_transcript_button.grid(row=2, column=0, padx=10, pady=10)
+
 # Scrollable Frame Class
 class ScrollableFrame(ttk.Frame):
     def __init__(self, container, *args, **kwargs):
@@ -240,5 +265,27 @@ result_label.pack(pady=10)
 export_button = tk.Button(scrollable_eligible.scrollable_frame, text="Export Eligible Students to CSV", command=lambda: export_eligible_students_to_csv(result_label.cget("text").split("\n")[1:]), font=("Arial", 12), bg="#FF9800", fg="white")
 export_button.pack(pady=10)
 
+# Student Transcript Page
+transcript_page = ttk.Frame(notebook)
+transcript_page.pack(fill="both", expand=True)
+notebook.add(transcript_page, text="Student Transcript")
+
+scrollable_transcript = ScrollableFrame(transcript_page)
+scrollable_transcript.pack(fill="both", expand=True)
+
+search_label = tk.Label(scrollable_transcript.scrollable_frame, text="Search by Roll Number or Name:", font=("Arial", 12))
+search_label.pack(pady=10)
+
+search_entry = tk.Entry(scrollable_transcript.scrollable_frame, width=50, font=("Arial", 12))
+search_entry.pack(pady=5)
+search_entry.bind("<KeyRelease>", lambda event: search_students(search_entry, search_results_listbox))
+
+search_results_listbox = tk.Listbox(scrollable_transcript.scrollable_frame, width=50, height=8, font=("Arial", 12))
+search_results_listbox.pack(pady=5)
+search_results_listbox.bind("<<ListboxSelect>>", lambda event: show_transcript(search_results_listbox, transcript_label))
+
+transcript_label = tk.Label(scrollable_transcript.scrollable_frame, text="Select a student to see their transcript.", font=("Arial", 12), justify="left")
+transcript_label.pack(pady=10)
+
 # Run the application
 root.mainloop()
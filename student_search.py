@@ -0,0 +1,136 @@
+import os
+import sqlite3
+import logging
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+from constants.database import queries
+from constants.database.config import DB_NAME
+
+logger = logging.getLogger(__name__)
+
+# Incremental refreshes larger than this share of the index rebuild it instead
+REBUILD_RATIO = 0.25
+
+def normalize(text: str) -> str:
+    """Case-folds text, strips accents and collapses whitespace for matching."""
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return ' '.join(stripped.casefold().split())
+
+def _name_keys(name: str) -> List[str]:
+    """Returns the normalized name starting at each word, so 'yam' finds 'Muhammad Yamman'."""
+    words = normalize(name).split(' ')
+    return [' '.join(words[i:]) for i in range(len(words))]
+
+class StudentIndex:
+    """
+    Prefix index over roll numbers and student names.
+
+    Keys are kept in sorted arrays of (key, roll_no) pairs, so a prefix
+    lookup is a binary search followed by a short scan. The index follows
+    the students table by rowid and picks up new or replaced students
+    without being rebuilt.
+    """
+
+    def __init__(self, db_path: str = DB_NAME):
+        self.db_path = db_path
+        self.students: Dict[str, Tuple[str, str]] = {}  # roll_no: (name, section)
+        self._roll_keys: List[Tuple[str, str]] = []
+        self._name_keys: List[Tuple[str, str]] = []
+        self._last_rowid = 0
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Loads every student and sorts the keys once."""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(queries.fetch_students_since, (0,)).fetchall()
+
+        self.students = {roll_no: (name, section) for _, roll_no, name, section in rows}
+        self._roll_keys = sorted((normalize(roll_no), roll_no) for roll_no in self.students)
+        self._name_keys = sorted(
+            (key, roll_no) for roll_no, (name, _) in self.students.items() for key in _name_keys(name)
+        )
+        self._last_rowid = rows[-1][0] if rows else 0
+        logger.info(f"Indexed {len(self.students)} students")
+
+    def _remove(self, roll_no: str) -> None:
+        name, _ = self.students.pop(roll_no)
+        for keys, key in [(self._roll_keys, normalize(roll_no))] + [
+                (self._name_keys, key) for key in _name_keys(name)]:
+            position = bisect_left(keys, (key, roll_no))
+            if position < len(keys) and keys[position] == (key, roll_no):
+                del keys[position]
+
+    def refresh(self) -> None:
+        """Indexes students added or replaced since the last refresh."""
+        with sqlite3.connect(self.db_path) as conn:
+            count, max_rowid = conn.execute(queries.get_student_index_state).fetchone()
+            if max_rowid == self._last_rowid:
+                if count != len(self.students):
+                    self.rebuild()  # Students were deleted
+                return
+            rows = conn.execute(queries.fetch_students_since, (self._last_rowid,)).fetchall()
+
+        if len(rows) > REBUILD_RATIO * max(len(self.students), 1):
+            self.rebuild()
+            return
+
+        for _, roll_no, name, section in rows:
+            if roll_no in self.students:
+                self._remove(roll_no)
+            self.students[roll_no] = (name, section)
+            insort(self._roll_keys, (normalize(roll_no), roll_no))
+            for key in _name_keys(name):
+                insort(self._name_keys, (key, roll_no))
+        self._last_rowid = rows[-1][0]
+        if count != len(self.students):
+            self.rebuild()  # Students were also deleted
+        logger.info(f"Indexed {len(rows)} new or updated students")
+
+    @staticmethod
+    def _prefix_matches(keys: List[Tuple[str, str]], prefix: str, limit: int, found: Dict[str, None]) -> None:
+        position = bisect_left(keys, (prefix, ''))
+        while position < len(keys) and len(found) < limit:
+            key, roll_no = keys[position]
+            if not key.startswith(prefix):
+                break
+            found.setdefault(roll_no)
+            position += 1
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[str, str, str]]:
+        """
+        Returns (roll_no, name, section) of students whose roll number or any
+        part of whose name starts with the query, roll number matches first.
+        """
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        found: Dict[str, None] = {}
+        self._prefix_matches(self._roll_keys, prefix, limit, found)
+        self._prefix_matches(self._name_keys, prefix, limit, found)
+        return [(roll_no,) + self.students[roll_no] for roll_no in found]
+
+_indexes: Dict[str, StudentIndex] = {}
+
+def get_student_index(db_path: str = DB_NAME) -> StudentIndex:
+    """Returns the process-wide index of a database, bringing it up to date."""
+    key = os.path.abspath(db_path)
+    index = _indexes.get(key)
+    if index is None:
+        index = _indexes[key] = StudentIndex(db_path)
+    else:
+        index.refresh()
+    return index
+
+def refresh_student_index(db_path: str = DB_NAME) -> None:
+    """Refreshes the database's index if one has been built in this process."""
+    index = _indexes.get(os.path.abspath(db_path))
+    if index is not None:
+        index.refresh()
+
+def fetch_transcript(roll_no: str, db_path: str = DB_NAME) -> List[Tuple[Optional[int], str, Optional[str], Optional[int], str]]:
+    """Returns (semester, course_code, title, credit_hours, grade) of a student, by semester."""
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(queries.fetch_transcript, (roll_no,)).fetchall()
@@ -0,0 +1,165 @@
+import re
+import logging
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from catalog_core import Course, append_courses_and_labs
+
+logger = logging.getLogger(__name__)
+
+# Line kinds produced by the tokenizer
+HEADER, TOTAL, CODE, NUMBER, EMPTY, TEXT = "header", "total", "code", "number", "empty", "text"
+
+SEMESTER_PATTERN = re.compile(r'^Semester-([IVXL]+)$')
+# CS1002, SExxxx, SS/MG, or the first half of a split code such as SS/ + MGxxxx
+CODE_PATTERN = re.compile(r'^[A-Z]{2}(?:\d{4}|x{4}|/|/[A-Z]{2}(?:\d{4}|x{4})?)$')
+ROMAN_NUMERALS = {'I': 1, 'V': 5, 'X': 10, 'L': 50}
+
+@dataclass
+class MalformedRow:
+    """A study plan row that could not be parsed."""
+    line_number: int
+    reason: str
+    text: str
+
+def _roman_to_int(numeral: str) -> int:
+    total = 0
+    for current, following in zip(numeral, numeral[1:] + ' '):
+        value = ROMAN_NUMERALS[current]
+        total += -value if ROMAN_NUMERALS.get(following, 0) > value else value
+    return total
+
+def classify(line: str) -> Tuple[str, object]:
+    """Classifies a stripped line of study plan text."""
+    if not line or line == '—':
+        return EMPTY, None
+    if line.isdigit():
+        return NUMBER, int(line)
+    if line.startswith('Total'):
+        return TOTAL, None
+    match = SEMESTER_PATTERN.match(line)
+    if match:
+        return HEADER, _roman_to_int(match.group(1))
+    if CODE_PATTERN.match(line):
+        return CODE, line
+    return TEXT, line
+
+def tokenize(text: str) -> List[Tuple[str, object, int]]:
+    """Splits study plan text into (kind, value, line_number) tokens."""
+    tokens = []
+    for line_number, line in enumerate(text.split('\n'), start=1):
+        kind, value = classify(line.strip())
+        tokens.append((kind, value, line_number))
+    return tokens
+
+def parse_study_plan(text: str, program_name: str) -> Tuple[List[Tuple[Course, str, int]], List[MalformedRow]]:
+    """
+    Parses a study plan in a single pass over its tokens.
+
+    Each course is a code (possibly split over lines ending in '/'), one or
+    more title lines, class and lab credit hours and a prerequisite line,
+    grouped under 'Semester-<roman>' headers and closed by 'Total' rows.
+    The plan ends at the first line after a semester total that is not
+    another semester header, so plans of any length are supported.
+
+    Returns:
+        The courses (with derived labs) and the rows that could not be parsed.
+    """
+    tokens = tokenize(text)
+    courses: List[Tuple[Course, str, int]] = []
+    malformed: List[MalformedRow] = []
+
+    state = "seek"
+    semester = 0
+    code_parts: List[str] = []
+    title_parts: List[str] = []
+    credit_hours_class = 0
+    credit_hours_lab = 0
+    start_line = 0
+
+    def reject(reason: str, line_number: int) -> None:
+        malformed.append(MalformedRow(start_line or line_number, reason, ''.join(code_parts)))
+
+    index = 0
+    while index < len(tokens):
+        kind, value, line_number = tokens[index]
+        index += 1
+
+        if state == "seek":
+            if kind == HEADER:
+                semester, state = value, "code"
+            continue
+
+        if state == "after_total":
+            if kind in (NUMBER, EMPTY):
+                continue
+            if kind != HEADER:
+                break  # End of the study plan
+            semester, state = value, "code"
+            continue
+
+        if kind in (HEADER, TOTAL):
+            if state != "code":
+                reject(f"incomplete course before line {line_number}", line_number)
+            if kind == HEADER:
+                semester, state = value, "code"
+            else:
+                state = "after_total"
+            continue
+
+        if state == "code":
+            if kind == CODE:
+                code_parts, title_parts, start_line = [value], [], line_number
+                state = "code_continued" if value.endswith('/') else "title"
+            elif kind != EMPTY:
+                start_line = 0
+                code_parts = [str(value)]
+                reject("expected a course code", line_number)
+            continue
+
+        if state == "code_continued":
+            if kind == EMPTY:
+                continue
+            code_parts.append(str(value))
+            state = "code_continued" if str(value).endswith('/') else "title"
+            continue
+
+        if state == "title":
+            if kind == NUMBER:
+                if not title_parts:
+                    reject("missing course title", line_number)
+                    state = "code"
+                    continue
+                credit_hours_class, state = value, "lab"
+            elif kind != EMPTY:
+                title_parts.append(value)
+            continue
+
+        if state == "lab":
+            if kind == NUMBER:
+                credit_hours_lab, state = value, "prereq"
+                continue
+            reject("missing lab credit hours", line_number)
+            state = "code"
+            index -= 1  # Re-read the line as the start of the next course
+            continue
+
+        if state == "prereq":
+            if kind in (CODE, EMPTY):
+                append_courses_and_labs(
+                    courses, ''.join(code_parts), ' '.join(title_parts),
+                    credit_hours_class, credit_hours_lab,
+                    value, program_name, semester
+                )
+            else:
+                reject(f"unrecognized prerequisite '{value}'", line_number)
+            state = "code"
+
+    if state not in ("after_total", "code", "seek"):
+        reject("study plan ended mid-course", tokens[-1][2] if tokens else 0)
+    if state == "seek":
+        malformed.append(MalformedRow(0, "no semester header found", ""))
+
+    for row in malformed:
+        logger.warning(f"Malformed study plan row for {program_name} at line {row.line_number}: {row.reason}")
+    return courses, malformed
@@ -0,0 +1,29 @@
+"""Tests for validating grade sheets against their batch's catalog."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog_core import CatalogWriter, Course, roll_no_batch  # noqa: E402
+from course_catalog import get_catalog  # noqa: E402
+from grade_processor import CourseValidator  # noqa: E402
+
+def _load(db_path, batch, title):
+    CatalogWriter(db_path).insert_courses([(Course("CS2001", title, 3, None), "SE", 3)], batch=batch)
+
+def test_roll_no_batch():
+    assert roll_no_batch("22P-3000") == "22"
+    assert roll_no_batch("Roll No") is None
+
+def test_each_batch_validates_against_its_own_catalog(tmp_path):
+    db_path = str(tmp_path / "catalog.sqlite3")
+    _load(db_path, "22", "Data Structures")
+    _load(db_path, "23", "Data Structures and Algorithms")
+
+    assert get_catalog(db_path).by_code["CS2001"].course_title == "Data Structures and Algorithms"
+    validator = CourseValidator(db_path)
+    assert validator.validate_course("Data Structures-CS2001", "22")[0]
+    assert validator.validate_course("Data Structures and Algorithms-CS2001", "23")[0]
+    assert not validator.validate_course("Data Structures-CS2001", "23")[0]
+    # Batches without a catalog fall back to the latest definitions
+    assert validator.validate_course("Data Structures and Algorithms-CS2001", "24")[0]
@@ -0,0 +1,58 @@
+"""Tests for the grade attempt history kept across cumulative grade sheets."""
+import os
+import sys
+import sqlite3
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constants.database.queries import fetch_grade_history  # noqa: E402
+from grade_processor import Student, initialize_student_schema, write_students  # noqa: E402
+
+def _student(grades):
+    return Student("22P-3000", "Muhammad Yamman", "BSE-223B", 0, 0, 0.0, 0, "Current", "", grades)
+
+@pytest.fixture
+def conn(tmp_path):
+    with sqlite3.connect(tmp_path / "grades.sqlite3") as conn:
+        initialize_student_schema(conn)
+        yield conn
+
+def _import(conn, grades, term, source_name="grade.csv"):
+    write_students(conn.cursor(), [_student(grades)], term, source_name)
+    conn.commit()
+
+def _history(conn):
+    return [(code, grade, term) for code, grade, term, _, _ in conn.execute(fetch_grade_history, ("22P-3000",))]
+
+def test_cumulative_sheets_append_only_changed_grades(conn):
+    _import(conn, {"CS1002": "B", "CS1004": "D+"}, "2024-2")
+    _import(conn, {"CS1002": "B", "CS1004": "A"}, "2025-1")
+    _import(conn, {"CS1002": "B", "CS1004": "A", "CS2001": "C"}, "2025-2")
+
+    assert _history(conn) == [
+        ("CS1002", "B", "2024-2"),
+        ("CS1004", "D+", "2024-2"),
+        ("CS1004", "A", "2025-1"),
+        ("CS2001", "C", "2025-2"),
+    ]
+    assert dict(conn.execute("SELECT course_code, grade FROM grades")) == {
+        "CS1002": "B", "CS1004": "A", "CS2001": "C",
+    }
+
+def test_reimporting_an_older_sheet_records_the_change_once(conn):
+    _import(conn, {"CS1004": "D+"}, "2024-2", "a.csv")
+    _import(conn, {"CS1004": "A"}, "2025-1", "b.csv")
+    _import(conn, {"CS1004": "D+"}, "2025-2", "a.csv")
+    _import(conn, {"CS1004": "D+"}, "2026-1", "a.csv")
+
+    assert _history(conn) == [("CS1004", "D+", "2024-2"), ("CS1004", "A", "2025-1"), ("CS1004", "D+", "2025-2")]
+
+def test_unchanged_import_leaves_no_source(conn):
+    count = "SELECT count(*) FROM grade_sources"
+    _import(conn, {"CS1004": "D+"}, "2024-2")
+    sources = conn.execute(count).fetchone()[0]
+    _import(conn, {"CS1004": "D+"}, "2025-1")
+
+    assert conn.execute(count).fetchone()[0] == sources
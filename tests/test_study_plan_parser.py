@@ -0,0 +1,94 @@
+"""Property-based tests for the study plan parser over generated plans."""
+import os
+import sys
+import random
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.parse_study_plan import WORDS, generate_plan  # noqa: E402
+from catalog_core import is_lab  # noqa: E402
+from study_plan_parser import MalformedRow, parse_study_plan  # noqa: E402
+
+EXAMPLES = 50
+
+def _cases(seed: int):
+    """Yields (semesters, courses_per_semester, plan_seed) drawn at random."""
+    rng = random.Random(seed)
+    for _ in range(EXAMPLES):
+        yield rng.randint(1, 16), rng.randint(1, 9), rng.randrange(1 << 30)
+
+def _courses(courses):
+    """Returns (course code digits, semester) of the parsed non-lab courses, in order."""
+    return [(course.course_code[-4:], semester) for course, _, semester in courses if not is_lab(course)]
+
+def test_courses_and_semesters_round_trip():
+    for semesters, per_semester, seed in _cases(1):
+        courses, malformed = parse_study_plan(generate_plan(semesters, per_semester, seed), "Synthetic")
+
+        assert not malformed
+        assert _courses(courses) == [
+            (f"{semester:02d}{number:02d}", semester)
+            for semester in range(1, semesters + 1)
+            for number in range(per_semester)
+        ]
+        assert all(program_name == "Synthetic" for _, program_name, _ in courses)
+
+@pytest.mark.parametrize("semesters", [1, 4, 7, 8, 9, 12, 20])
+def test_plans_of_any_length_parse_fully(semesters):
+    courses, malformed = parse_study_plan(generate_plan(semesters, seed=semesters), "Synthetic")
+
+    assert not malformed
+    assert {semester for _, _, semester in courses} == set(range(1, semesters + 1))
+    assert len(_courses(courses)) == semesters * 6
+
+def test_truncated_plans_report_malformed_rows():
+    rng = random.Random(2)
+    for semesters, per_semester, seed in _cases(2):
+        text = generate_plan(semesters, per_semester, seed)
+        full, _ = parse_study_plan(text, "Synthetic")
+        lines = text.split("\n")
+        cut = rng.randrange(len(lines))
+
+        courses, malformed = parse_study_plan("\n".join(lines[:cut]), "Synthetic")
+
+        assert all(isinstance(row, MalformedRow) for row in malformed)
+        assert courses == full[:len(courses)]
+
+def test_truncated_mid_course_is_malformed():
+    for semesters, per_semester, seed in _cases(3):
+        lines = generate_plan(semesters, per_semester, seed).split("\n")
+        # Cut inside a course title, before its credit hours
+        title_lines = [i for i, line in enumerate(lines) if line.split(" ")[0] in WORDS]
+        cut = random.Random(seed).choice(title_lines) + 1
+
+        courses, malformed = parse_study_plan("\n".join(lines[:cut]), "Synthetic")
+
+        assert malformed
+        assert malformed[-1].reason == "study plan ended mid-course"
+
+def test_garbled_plans_report_malformed_rows():
+    rng = random.Random(4)
+    garbage = ["", "—", "42", "Total", "Semester-IV", "SS/", "CS9999", "?? lorem ipsum ??", "Semester-Q"]
+    for semesters, per_semester, seed in _cases(4):
+        lines = generate_plan(semesters, per_semester, seed).split("\n")
+        for _ in range(rng.randint(1, 10)):
+            position = rng.randrange(len(lines))
+            if rng.random() < 0.5:
+                lines[position] = rng.choice(garbage)
+            else:
+                del lines[position]
+            if not lines:
+                break
+
+        courses, malformed = parse_study_plan("\n".join(lines), "Synthetic")
+
+        assert isinstance(courses, list)
+        assert all(isinstance(row, MalformedRow) for row in malformed)
+
+def test_text_without_a_plan_is_malformed():
+    courses, malformed = parse_study_plan("Code\nTitle\nCS1002\nProgramming", "Synthetic")
+
+    assert courses == []
+    assert [row.reason for row in malformed] == ["no semester header found"]
@@ -0,0 +1,218 @@
+import sqlite3
+import logging
+import argparse
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from constants.database import queries
+from constants.database.config import DB_NAME, SECTION_CAPACITY
+from course_catalog import get_catalog
+
+
+@dataclass
+class SectionAssignment:
+    """A single section of an offered course placed in a timetable slot."""
+    course_code: str
+    section: int
+    slot: int
+    students: int  # bitset over TimetableScheduler.roll_numbers
+    size: int
+    clashes: int  # students already seated in another course in this slot
+
+
+class TimetableScheduler:
+    """
+    Detects timetable clashes between offered courses.
+
+    Eligible students of every course are kept as integer bitsets indexed by
+    roll number, so the overlap between two courses is a single AND followed
+    by a popcount, regardless of how many students are enrolled.
+    """
+
+    def __init__(self, db_path: str = DB_NAME, section_capacity: int = SECTION_CAPACITY):
+        self.db_path = db_path
+        self.section_capacity = section_capacity
+        self.logger = logging.getLogger(__name__)
+        self.roll_numbers: List[str] = []
+        self.eligibility: Dict[str, int] = {}
+        self.load_eligibility()
+
+    def load_eligibility(self) -> None:
+        """Builds per-course bitsets of eligible roll numbers from the database."""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(queries.get_eligible_rolls_by_course).fetchall()
+
+        roll_index: Dict[str, int] = {}
+        positions: Dict[str, List[int]] = {}
+        for course_code, roll_no in rows:
+            bit = roll_index.setdefault(roll_no, len(roll_index))
+            positions.setdefault(course_code, []).append(bit)
+
+        # Set bits in a byte buffer and convert once, instead of OR-ing
+        # a growing integer for every eligible student
+        size = (len(roll_index) + 7) // 8
+        self.eligibility = {}
+        for course_code, bits in positions.items():
+            buffer = bytearray(size)
+            for bit in bits:
+                buffer[bit >> 3] |= 1 << (bit & 7)
+            self.eligibility[course_code] = int.from_bytes(buffer, "little")
+
+        self.roll_numbers = list(roll_index)
+        self.logger.info(
+            f"Loaded eligibility for {len(self.eligibility)} courses "
+            f"across {len(self.roll_numbers)} students."
+        )
+
+    def members(self, students: int) -> List[str]:
+        """Decodes a student bitset into roll numbers."""
+        rolls = []
+        while students:
+            low = students & -students
+            rolls.append(self.roll_numbers[low.bit_length() - 1])
+            students ^= low
+        return rolls
+
+    def fetch_offerings(self, program_name: str, semester: int) -> List[str]:
+        """Returns the course codes offered to a program in a semester."""
+        return [course.course_code for course in get_catalog(self.db_path).offerings(program_name, semester)]
+
+    def conflict_graph(self, course_codes: List[str]) -> Dict[Tuple[str, str], int]:
+        """
+        Computes the pairwise conflict graph of a set of courses.
+
+        Returns:
+            A mapping of course pairs to the number of students eligible for
+            both. Pairs without shared students are omitted.
+        """
+        courses = [
+            (code, self.eligibility[code])
+            for code in dict.fromkeys(course_codes)
+            if self.eligibility.get(code)
+        ]
+        graph = {}
+        for i, (code_a, students_a) in enumerate(courses):
+            for code_b, students_b in courses[i + 1:]:
+                shared = (students_a & students_b).bit_count()
+                if shared:
+                    graph[(code_a, code_b)] = shared
+        return graph
+
+    def assign_slots(self, course_codes: List[str],
+                     slots: Optional[int] = None) -> List[SectionAssignment]:
+        """
+        Proposes a clash-minimizing slot for every section of the given courses.
+
+        Courses are placed most-conflicted first. Each course is split into
+        sections of ``section_capacity`` students and every section goes to
+        the slot where the fewest of its remaining students are already
+        seated, filling it with non-clashing students before clashing ones.
+
+        Args:
+            course_codes: Courses to schedule.
+            slots: Number of available slots. When omitted, a new slot is
+                opened whenever every existing slot would cause a clash.
+        """
+        graph = self.conflict_graph(course_codes)
+        weight: Dict[str, int] = {}
+        for (code_a, code_b), shared in graph.items():
+            weight[code_a] = weight.get(code_a, 0) + shared
+            weight[code_b] = weight.get(code_b, 0) + shared
+
+        order = sorted(
+            dict.fromkeys(course_codes),
+            key=lambda code: (-weight.get(code, 0), -self.eligibility.get(code, 0).bit_count(), code),
+        )
+
+        seated: List[int] = [0] * (slots or 0)
+        assignments = []
+        for course_code in order:
+            remaining = self.eligibility.get(course_code, 0)
+            section = 0
+            while remaining or section == 0:
+                section += 1
+                slot = self._best_slot(remaining, seated, slots is None)
+                if slot == len(seated):
+                    seated.append(0)
+
+                free = remaining & ~seated[slot]
+                students, _ = self._take(free, self.section_capacity)
+                space = self.section_capacity - students.bit_count()
+                if space:
+                    extra, _ = self._take(remaining & seated[slot], space)
+                    students |= extra
+
+                clashes = (students & seated[slot]).bit_count()
+                remaining &= ~students
+                seated[slot] |= students
+                assignments.append(SectionAssignment(
+                    course_code=course_code,
+                    section=section,
+                    slot=slot,
+                    students=students,
+                    size=students.bit_count(),
+                    clashes=clashes,
+                ))
+
+        total_clashes = sum(a.clashes for a in assignments)
+        self.logger.info(
+            f"Scheduled {len(assignments)} sections in {len(seated)} slots "
+            f"with {total_clashes} clashing seats."
+        )
+        return assignments
+
+    @staticmethod
+    def _best_slot(students: int, seated: List[int], can_open: bool) -> int:
+        """Finds the slot where the fewest of ``students`` are already seated."""
+        best_slot, best_clashes = None, None
+        for slot, occupied in enumerate(seated):
+            clashes = (students & occupied).bit_count()
+            if best_clashes is None or clashes < best_clashes:
+                best_slot, best_clashes = slot, clashes
+                if clashes == 0:
+                    break
+        if best_slot is None or (best_clashes and can_open):
+            return len(seated)
+        return best_slot
+
+    @staticmethod
+    def _take(students: int, count: int) -> Tuple[int, int]:
+        """Splits off the ``count`` lowest-indexed students of a bitset."""
+        taken = 0
+        while students and count:
+            low = students & -students
+            taken |= low
+            students ^= low
+            count -= 1
+        return taken, students
+
+    def schedule_semester(self, program_name: str, semester: int,
+                          slots: Optional[int] = None) -> List[SectionAssignment]:
+        """Schedules every course offered to a program in a semester."""
+        return self.assign_slots(self.fetch_offerings(program_name, semester), slots)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+    )
+
+    parser = argparse.ArgumentParser(description="Propose a clash-free timetable for a semester.")
+    parser.add_argument("program", help="Program name, e.g. 'Software Engineering'")
+    parser.add_argument("semester", type=int)
+    parser.add_argument("--slots", type=int, default=None, help="Number of available slots")
+    args = parser.parse_args()
+
+    scheduler = TimetableScheduler()
+    offerings = scheduler.fetch_offerings(args.program, args.semester)
+
+    for (code_a, code_b), shared in sorted(scheduler.conflict_graph(offerings).items()):
+        print(f"{code_a} x {code_b}: {shared} shared students")
+
+    for assignment in scheduler.assign_slots(offerings, args.slots):
+        print(
+            f"Slot {assignment.slot + 1}: {assignment.course_code} "
+            f"section {assignment.section} ({assignment.size} students, "
+            f"{assignment.clashes} clashes)"
+        )